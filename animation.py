@@ -1,7 +1,64 @@
+import time
 import pygame
+import numpy as np
 from typing import Union
+from trace_log import Trace
 
-pygame.init()
+# Fonts and rendered text kept between frames, as looking a font up and
+# rendering text are far slower than blitting. pygame.quit() invalidates
+# both, so they are cleared when an animation closes.
+font_cache = {}
+text_cache = {}
+TEXT_CACHE_SIZE = 4096
+
+# The most floors drawn at once; taller buildings scroll.
+VISIBLE_FLOORS = 20
+
+
+def get_font(font_name: str = 'comicsansms', font_size: int = 30):
+    """
+    Returns a system font, looking it up only the first time it is asked for.
+
+    :param str font_name: The name of the system font, defaults to comicsansms.
+    :param int font_size: The size of the font, defaults to 30.
+
+    :return: The font.
+    :rtype: pygame.font.Font
+    """
+    key = (font_name, font_size)
+    if key not in font_cache:
+        font_cache[key] = pygame.font.SysFont(font_name, font_size)
+
+    return font_cache[key]
+
+
+def render_text(text: str, font_name: str = 'comicsansms', font_size: int = 30, colour: tuple = (0, 0, 0)):
+    """
+    Returns a surface with some text rendered on it, rendering it only the first time it is asked for.
+
+    :param str text: The text to render.
+    :param str font_name: The name of the system font, defaults to comicsansms.
+    :param int font_size: The size of the font, defaults to 30.
+    :param tuple colour: The colour of the text, defaults to black.
+
+    :return: The rendered text.
+    :rtype: pygame.Surface
+    """
+    key = (text, font_name, font_size, colour)
+    text_surface = text_cache.get(key)
+    if text_surface is None:
+        if len(text_cache) >= TEXT_CACHE_SIZE:
+            text_cache.clear()
+
+        text_surface = text_cache[key] = get_font(font_name, font_size).render(text, True, colour)
+
+    return text_surface
+
+
+def clear_font_caches():
+    """ Forgets every cached font and rendered text. """
+    font_cache.clear()
+    text_cache.clear()
 
 
 def canvas_init(canvas_x: int, canvas_y: int):
@@ -14,6 +71,7 @@ def canvas_init(canvas_x: int, canvas_y: int):
     :return: The canvas onto which animation is done.
     :rtype: object
     """
+    pygame.init()
     canvas = pygame.display.set_mode((canvas_x, canvas_y))
     return canvas
 
@@ -129,4 +187,676 @@ def draw_building_lines(canvas: object, no_floors: int, lift_width: int, lift_he
             point_1 = (point_1_x, point_1_y)
             point_2 = (point_2_x, point_2_y)
 
-            pygame.draw.line(canvas, line_colour, point_1, point_2)
\ No newline at end of file
+            pygame.draw.line(canvas, line_colour, point_1, point_2)
+
+
+def calc_people_text_centre(no_floors: int, lift_height: int, lift_x_coord: int, floor_number: int) -> tuple:
+    """
+    Calculates where the number of people on a floor is drawn.
+
+    :param int no_floors: The total number of floors in the building.
+    :param int lift_height: The pixel height of the lift itself.
+    :param int lift_x_coord: The X coordinate of the top left corner of the lift itself.
+    :param int floor_number: The floor.
+
+    :return: The X and Y coordinates of the centre of the text.
+    :rtype: tuple
+    """
+    if lift_height == 60:
+        text_rectangle_x = lift_x_coord + 80
+    elif lift_height == 40:
+        text_rectangle_x = lift_x_coord + 60
+    else:
+        text_rectangle_x = lift_x_coord + 50
+
+    if floor_number == no_floors:
+        text_rectangle_y = 10 + (lift_height // 2)
+    elif floor_number == 1:
+        text_rectangle_y = (20 + (no_floors * lift_height) + ((no_floors - 1) * 3)) - (10 + (lift_height // 2))
+    else:
+        text_rectangle_y = ((12 + lift_height) + ((no_floors - floor_number) * (lift_height + 3))) - 2 - (
+                lift_height // 2)
+
+    return text_rectangle_x, text_rectangle_y
+
+
+class LiftAnimation:
+    """
+    Animates a running lift simulation.
+
+    The simulations themselves never import pygame; they hand the current
+    floor of the lift and the people waiting on each floor to this class
+    once per step.
+
+    The simulation is paced at a number of steps per second, one per
+    floor at normal speed, and frames are drawn from it at up to the
+    frame rate; steps in between frames are not drawn. Up and down double
+    and halve the speed, and return switches between that speed and
+    running the simulation as fast as it can go.
+
+    The building is drawn once, to a background surface. Each frame only
+    redraws the lift and the floor text that changed, and only those
+    parts of the window are updated.
+
+    :param int no_floors: The total number of floors in the building.
+    :param float speed: How many times normal speed to run at, defaults to 1. None runs as fast as possible.
+    :param int frame_rate: The most frames drawn each second, defaults to 60.
+    """
+
+    def __init__(self, no_floors: int, speed: float = 1.0, frame_rate: int = 60):
+        """ LiftAnimation Constructor. """
+        self.no_floors = no_floors
+        floors_in_view = self.calc_floors_in_view()
+        self.canvas_x, self.canvas_y = calc_canvas_size(floors_in_view)
+        self.lift_width, self.lift_height = calc_elevator_size(floors_in_view)
+        self.canvas = canvas_init(self.canvas_x, self.canvas_y)
+        self.clock = pygame.time.Clock()
+        self.lift_x_coord = (self.canvas_x - self.lift_width) // 2
+        self.lift_colour = (60, 69, 82)
+        self.start_pacing(speed, frame_rate)
+
+        # The floor lines are the same every frame, so they are drawn once.
+        self.background = self.canvas.copy()
+        draw_white_bg(self.background)
+        draw_building_lines(self.background, floors_in_view, self.lift_width, self.lift_height, self.lift_x_coord)
+
+        # What is on screen: the lift, and each text with its area, by where it is drawn.
+        self.lift_rect = None
+        self.floor_texts = {}
+        self.needs_full_redraw = True
+
+    def calc_floors_in_view(self) -> int:
+        """
+        Calculates how many floors are drawn at once.
+
+        :return: The number of floors in view.
+        :rtype: int
+        """
+        return self.no_floors
+
+    def calc_lift_y_coord(self, current_floor: int) -> int:
+        """
+        Calculates the Y coordinate of the top left corner of the lift.
+
+        :param int current_floor: The floor the lift is on, counting from the lowest floor in view.
+
+        :return: The Y coordinate, in pixels, of the lift.
+        :rtype: int
+        """
+        return self.canvas_y - (self.lift_height + 10) - ((current_floor - 1) * (self.lift_height + 3))
+
+    def calc_lift_rect(self, current_floor: int) -> pygame.Rect:
+        """
+        Calculates the area the lift is drawn in.
+
+        :param int current_floor: The floor the lift is on.
+
+        :return: The area of the lift.
+        :rtype: pygame.Rect
+        """
+        return pygame.Rect(self.lift_x_coord, self.calc_lift_y_coord(current_floor), self.lift_width, self.lift_height)
+
+    def calc_floor_texts(self, current_floor: int, occurrence_array: list) -> dict:
+        """
+        Works out the text drawn on the floors: the number of people waiting on each floor with anyone waiting.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+
+        :return: The string, font size, colour and centre of each text, by where it is drawn.
+        :rtype: dict
+        """
+        floor_texts = {}
+        for floor_number in range(1, len(occurrence_array)):
+            occurrences = int(occurrence_array[floor_number])
+            if occurrences:
+                floor_texts[floor_number] = (str(occurrences), 30, (0, 0, 0), calc_people_text_centre(
+                    self.no_floors, self.lift_height, self.lift_x_coord, floor_number
+                ))
+
+        return floor_texts
+
+    def start_pacing(self, speed: float, frame_rate: int):
+        """
+        Sets up the pacing of the simulation and its frames.
+
+        :param float speed: How many times normal speed to run at. None runs as fast as possible.
+        :param int frame_rate: The most frames drawn each second.
+        """
+        self.frame_rate = frame_rate
+        self.next_frame_time = 0.0
+        self.step_count = 0
+        self.last_speed = speed or 1.0
+        self.set_speed(speed)
+
+    def set_speed(self, speed: float):
+        """
+        Sets how fast the simulation runs.
+
+        :param float speed: How many times normal speed to run at. None runs as fast as possible.
+        """
+        self.speed = speed
+        if speed is not None:
+            self.last_speed = speed
+
+        # Pacing restarts from now, so changing speed never makes the lift jump.
+        self.pace_start_time = time.perf_counter()
+        self.pace_start_step = self.step_count
+
+    def note_changed_floors(self, floors=None):
+        """
+        Notes the floors whose number of people waiting may have changed
+        since the last frame. Every floor in view is checked each frame
+        here, so there is nothing to note.
+
+        :param floors: The floors, defaults to None for every floor.
+        """
+
+    def is_closed(self) -> bool:
+        """
+        Handles pending window events, once per frame.
+
+        :return: Whether the window has been closed.
+        :rtype: bool
+        """
+        if time.perf_counter() < self.next_frame_time:
+            return False
+
+        is_closed = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                is_closed = True
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    self.set_speed(self.last_speed * 2)
+                elif event.key == pygame.K_DOWN:
+                    self.set_speed(self.last_speed / 2)
+                elif event.key == pygame.K_RETURN:
+                    self.set_speed(self.last_speed if self.speed is None else None)
+
+        return is_closed
+
+    def draw(self, current_floor: int, occurrence_array: list):
+        """
+        Hands a step of the simulation to the animation. The step is drawn
+        if a frame is due, then the simulation is held back if it is ahead
+        of its speed.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+        """
+        self.step_count += 1
+
+        now = time.perf_counter()
+        if now >= self.next_frame_time:
+            self.render(current_floor, occurrence_array)
+            self.next_frame_time = now + 1 / self.frame_rate
+
+        if self.speed is not None:
+            steps_per_second = self.no_floors * self.speed
+            step_time = self.pace_start_time + (self.step_count - self.pace_start_step) / steps_per_second
+            time_ahead = step_time - time.perf_counter()
+            if time_ahead > 0.001:
+                time.sleep(time_ahead)
+
+    def render(self, current_floor: int, occurrence_array: list):
+        """
+        Draws a single frame of the animation, updating only the parts of the window that changed.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+        """
+        dirty_rects = self.redraw(current_floor, occurrence_array)
+
+        if self.needs_full_redraw:
+            pygame.display.flip()
+            self.needs_full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    def redraw(self, current_floor: int, occurrence_array: list) -> list:
+        """
+        Redraws everything on the canvas that has changed since the last frame.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+
+        :return: The areas of the canvas that changed.
+        :rtype: list
+        """
+        lift_rect = self.calc_lift_rect(current_floor)
+        floor_texts = self.calc_floor_texts(current_floor, occurrence_array)
+        dirty_rects = []
+
+        if self.needs_full_redraw:
+            self.floor_texts = {}
+            self.lift_rect = None
+
+        # Take down every text that has changed or gone, then put up the new ones.
+        for place in [place for place, (text, _) in self.floor_texts.items() if floor_texts.get(place) != text]:
+            dirty_rects.append(self.floor_texts.pop(place)[1])
+
+        for place, text in floor_texts.items():
+            if place not in self.floor_texts:
+                string, font_size, colour, centre = text
+                text_rectangle = render_text(string, font_size=font_size, colour=colour).get_rect(center=centre)
+                self.floor_texts[place] = (text, text_rectangle)
+                dirty_rects.append(text_rectangle)
+
+        if lift_rect != self.lift_rect:
+            if self.lift_rect is not None:
+                dirty_rects.append(self.lift_rect)
+            dirty_rects.append(lift_rect)
+            self.lift_rect = lift_rect
+
+        if self.needs_full_redraw:
+            self.canvas.blit(self.background, (0, 0))
+        elif not dirty_rects:
+            return dirty_rects
+        else:
+            for rect in dirty_rects:
+                self.canvas.blit(self.background, rect, rect)
+
+        # Redraw everything that overlaps a changed area, lift last so it stays on top.
+        for (string, font_size, colour, _), text_rectangle in self.floor_texts.values():
+            if self.needs_full_redraw or text_rectangle.collidelist(dirty_rects) != -1:
+                self.canvas.blit(render_text(string, font_size=font_size, colour=colour), text_rectangle)
+        pygame.draw.rect(self.canvas, self.lift_colour, lift_rect)
+
+        return dirty_rects
+
+    def close(self):
+        """ Closes the animation window. """
+        clear_font_caches()
+        pygame.quit()
+
+
+class ScrollingLiftAnimation(LiftAnimation):
+    """
+    Animates a lift in a building too tall to fit in the window.
+
+    The window shows VISIBLE_FLOORS floors at a time, following the lift,
+    and only those floors are drawn. Down the left hand side, a strip
+    shows the whole building at once: each row of pixels is shaded by how
+    many people are waiting on the floors it covers, with the visible
+    floors boxed and the lift marked.
+
+    People only stop waiting on floors the lift has been on, so the strip
+    only rebuilds the rows of those floors, and a frame costs the same
+    however tall the building is.
+
+    :param int no_floors: The total number of floors in the building.
+    :param float speed: How many times normal speed to run at, defaults to 1. None runs as fast as possible.
+    :param int frame_rate: The most frames drawn each second, defaults to 60.
+    """
+
+    def __init__(self, no_floors: int, speed: float = 1.0, frame_rate: int = 60):
+        """ ScrollingLiftAnimation Constructor. """
+        self.lowest_floor = 1
+        super().__init__(no_floors, speed, frame_rate)
+        self.label_x_coord = self.lift_x_coord - (self.lift_width + 120)
+
+        # The box and lift mark drawn over the strip reach past its sides, so the area redrawn is wider.
+        self.strip_rect = pygame.Rect(20, 10, 30, self.canvas_y - 20)
+        self.strip_area = self.strip_rect.inflate(10, 2)
+        pygame.draw.rect(self.background, (0, 0, 0), self.strip_rect.inflate(2, 2), 1)
+
+        # The strip row of each floor, counting down from the top, and the floor shown on each row.
+        strip_height = self.strip_rect.height
+        self.floor_rows = (strip_height - 1) - (np.arange(no_floors) * strip_height // no_floors)
+        self.row_floors = (no_floors - 1) - (np.arange(strip_height) * no_floors // strip_height)
+
+        # The rows each floor covers, for when there are fewer floors than rows.
+        self.first_rows = np.searchsorted(-self.row_floors, -np.arange(no_floors), side="left")
+        self.last_rows = np.searchsorted(-self.row_floors, -np.arange(no_floors), side="right")
+
+        # The people waiting on each floor and row as last drawn, and the floors that may have changed since.
+        self.strip_surface = pygame.Surface((1, strip_height))
+        self.strip_image = None
+        self.strip_counts = None
+        self.strip_density = None
+        self.strip_marks = None
+        self.changed_floors = None
+
+    def calc_floors_in_view(self) -> int:
+        """
+        Calculates how many floors are drawn at once.
+
+        :return: The number of floors in view.
+        :rtype: int
+        """
+        return VISIBLE_FLOORS
+
+    def calc_lowest_visible_floor(self, current_floor: int) -> int:
+        """
+        Calculates the lowest floor in view, keeping the lift in the middle where possible.
+
+        :param int current_floor: The floor the lift is on.
+
+        :return: The lowest floor in view.
+        :rtype: int
+        """
+        return min(max(current_floor - VISIBLE_FLOORS // 2, 1), self.no_floors - VISIBLE_FLOORS + 1)
+
+    def calc_lift_rect(self, current_floor: int) -> pygame.Rect:
+        """
+        Calculates the area the lift is drawn in, within the floors in view.
+
+        :param int current_floor: The floor the lift is on.
+
+        :return: The area of the lift.
+        :rtype: pygame.Rect
+        """
+        return super().calc_lift_rect(current_floor - self.lowest_floor + 1)
+
+    def calc_floor_texts(self, current_floor: int, occurrence_array: list) -> dict:
+        """
+        Works out the text drawn on the floors in view: the number of each
+        floor, and the number of people waiting on it if there is anyone.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+
+        :return: The string, font size, colour and centre of each text, by where it is drawn.
+        :rtype: dict
+        """
+        floor_texts = {}
+        for visible_floor in range(1, VISIBLE_FLOORS + 1):
+            floor_number = self.lowest_floor + visible_floor - 1
+            floor_texts["label", visible_floor] = (str(floor_number), 16, (128, 128, 128), (
+                self.label_x_coord, self.calc_lift_y_coord(visible_floor) + self.lift_height // 2
+            ))
+
+            occurrences = int(occurrence_array[floor_number])
+            if occurrences:
+                floor_texts["people", visible_floor] = (str(occurrences), 30, (0, 0, 0), calc_people_text_centre(
+                    VISIBLE_FLOORS, self.lift_height, self.lift_x_coord, visible_floor
+                ))
+
+        return floor_texts
+
+    def calc_strip_row(self, floor: int) -> int:
+        """
+        Calculates the Y coordinate of a floor on the strip.
+
+        :param int floor: The floor.
+
+        :return: The Y coordinate, in pixels, of the floor on the strip.
+        :rtype: int
+        """
+        return self.strip_rect.top + int(self.floor_rows[floor - 1])
+
+    def note_changed_floors(self, floors=None):
+        """
+        Notes the floors whose number of people waiting may have changed
+        since the last frame, so their rows of the strip are rebuilt.
+
+        :param floors: The floors, defaults to None for every floor.
+        """
+        if floors is None:
+            self.changed_floors = None
+        elif self.changed_floors is not None:
+            self.changed_floors.update(floors)
+
+    def draw(self, current_floor: int, occurrence_array: list):
+        """
+        Hands a step of the simulation to the animation, noting the floor
+        the lift is on, as people may get in there.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+        """
+        if self.changed_floors is not None:
+            self.changed_floors.add(current_floor)
+
+        super().draw(current_floor, occurrence_array)
+
+    def update_strip_image(self, current_floor: int, occurrence_array) -> bool:
+        """
+        Brings the image of the strip up to date, rebuilding only the rows of floors that changed.
+
+        :param int current_floor: The floor the lift is on.
+        :param occurrence_array: Number of people on each floor, indexed by floor.
+
+        :return: Whether the image changed.
+        :rtype: bool
+        """
+        is_changed = False
+        if self.changed_floors is None:
+            self.strip_counts = np.array(occurrence_array[1:self.no_floors + 1], dtype=np.float64)
+            if self.no_floors > self.strip_rect.height:
+                self.strip_density = np.bincount(self.floor_rows, weights=self.strip_counts,
+                                                 minlength=self.strip_rect.height)
+            else:
+                self.strip_density = self.strip_counts[self.row_floors]
+            is_changed = True
+
+        else:
+            for floor in self.changed_floors:
+                occurrences = int(occurrence_array[floor])
+                if occurrences == self.strip_counts[floor - 1]:
+                    continue
+
+                if self.no_floors > self.strip_rect.height:
+                    self.strip_density[self.floor_rows[floor - 1]] += occurrences - self.strip_counts[floor - 1]
+                else:
+                    self.strip_density[self.first_rows[floor - 1]:self.last_rows[floor - 1]] = occurrences
+                self.strip_counts[floor - 1] = occurrences
+                is_changed = True
+
+        # People can still get in on the floor the lift is on before it moves.
+        self.changed_floors = {current_floor}
+
+        if is_changed:
+            shade = 255 - (self.strip_density * (255 / max(self.strip_density.max(), 1))).astype(np.uint8)
+            pygame.surfarray.blit_array(self.strip_surface, np.repeat(shade, 3).reshape(1, -1, 3))
+            self.strip_image = pygame.transform.scale(self.strip_surface, self.strip_rect.size)
+
+        return is_changed
+
+    def draw_density_strip(self, current_floor: int, occurrence_array) -> bool:
+        """
+        Draws the strip showing how many people are waiting across the whole building, if it has changed.
+
+        :param int current_floor: The floor the lift is on.
+        :param occurrence_array: Number of people on each floor, indexed by floor.
+
+        :return: Whether the strip was drawn.
+        :rtype: bool
+        """
+        is_image_changed = self.update_strip_image(current_floor, occurrence_array)
+        strip_marks = (self.lowest_floor, current_floor)
+        if not (is_image_changed or self.needs_full_redraw or strip_marks != self.strip_marks):
+            return False
+
+        self.strip_marks = strip_marks
+        self.canvas.blit(self.background, self.strip_area, self.strip_area)
+        self.canvas.blit(self.strip_image, self.strip_rect)
+
+        top_row = self.calc_strip_row(self.lowest_floor + VISIBLE_FLOORS - 1)
+        bottom_row = self.calc_strip_row(self.lowest_floor)
+        pygame.draw.rect(self.canvas, (0, 0, 255),
+                         pygame.Rect(self.strip_rect.left - 4, top_row, self.strip_rect.width + 8,
+                                     bottom_row - top_row + 1), 1)
+        lift_row = self.calc_strip_row(current_floor)
+        pygame.draw.line(self.canvas, (255, 0, 0), (self.strip_rect.left, lift_row), (self.strip_rect.right, lift_row))
+
+        return True
+
+    def redraw(self, current_floor: int, occurrence_array: list) -> list:
+        """
+        Redraws everything on the canvas that has changed since the last frame, strip included.
+
+        :param int current_floor: The floor the lift is on.
+        :param list occurrence_array: Number of people on each floor, indexed by floor.
+
+        :return: The areas of the canvas that changed.
+        :rtype: list
+        """
+        self.lowest_floor = self.calc_lowest_visible_floor(current_floor)
+        dirty_rects = super().redraw(current_floor, occurrence_array)
+
+        # The strip is clear of the building, so redrawing it never covers anything else.
+        if self.draw_density_strip(current_floor, occurrence_array):
+            dirty_rects.append(self.strip_area)
+
+        return dirty_rects
+
+
+def create_animation(no_floors: int, speed: float = 1.0, frame_rate: int = 60) -> LiftAnimation:
+    """
+    Creates the animation for a building, scrolling if it is too tall to show at once.
+
+    :param int no_floors: The total number of floors in the building.
+    :param float speed: How many times normal speed to run at, defaults to 1. None runs as fast as possible.
+    :param int frame_rate: The most frames drawn each second, defaults to 60.
+
+    :return: The animation.
+    :rtype: LiftAnimation
+    """
+    if no_floors > VISIBLE_FLOORS:
+        return ScrollingLiftAnimation(no_floors, speed, frame_rate)
+
+    return LiftAnimation(no_floors, speed, frame_rate)
+
+
+class TracePlayer:
+    """
+    Plays back a recorded trace of a run, so the run itself can go at
+    full speed with no animation.
+
+    Playback moves through the steps of the run at a set number of steps
+    per second, independent of the frame rate. Space pauses, the left and
+    right arrows seek back and forward, up and down double and halve the
+    speed, and Home and End jump to the start and end of the run.
+
+    :param Trace trace: The trace to play.
+    :param float steps_per_second: How fast to play the run, defaults to None for one step per floor each second.
+    :param int frame_rate: The most frames drawn each second, defaults to 60.
+    """
+
+    def __init__(self, trace: Trace, steps_per_second: float = None, frame_rate: int = 60):
+        """ TracePlayer Constructor. """
+        self.trace = trace
+        self.steps = np.asarray(trace.records["step"])
+        self.steps_per_second = steps_per_second or trace.number_of_floors
+        self.frame_rate = frame_rate
+        self.is_paused = False
+        self.position = float(self.steps[0]) if len(self.steps) else 0.0
+        self.record_index = -1
+        self.occurrence_array = np.array(trace.floor_counts, dtype=np.int64)
+        self.animation = None
+
+    @property
+    def last_step(self) -> int:
+        """ The last step of the run. """
+        return int(self.steps[-1]) if len(self.steps) else 0
+
+    def seek(self, step: float):
+        """
+        Moves playback to a step of the run.
+
+        :param float step: The step to move to, clamped to the run.
+        """
+        self.position = min(max(float(step), 0.0), float(self.last_step))
+
+    def toggle_pause(self):
+        """ Pauses or resumes playback. """
+        self.is_paused = not self.is_paused
+
+    def set_speed(self, steps_per_second: float):
+        """
+        Sets how fast the run is played.
+
+        :param float steps_per_second: The number of steps played each second.
+        """
+        self.steps_per_second = max(steps_per_second, 1e-3)
+
+    def state_at(self, step: float) -> tuple:
+        """
+        Returns where the lift was and who was waiting on each floor at a step.
+
+        Moving forward applies just the records passed; moving back rebuilds
+        the waiting counts from the start of the trace.
+
+        :param float step: The step of the run.
+
+        :return: The floor the lift was on and the number of people waiting on each floor.
+        :rtype: tuple
+        """
+        record_index = int(np.searchsorted(self.steps, step, side="right")) - 1
+        records = self.trace.records
+
+        if record_index < self.record_index:
+            self.occurrence_array = np.array(self.trace.floor_counts, dtype=np.int64)
+            self.record_index = -1
+            if self.animation is not None:
+                self.animation.note_changed_floors()
+
+        if record_index > self.record_index:
+            passed = records[self.record_index + 1:record_index + 1]
+            self.occurrence_array -= np.bincount(
+                passed["floor"], weights=passed["boarded"], minlength=len(self.occurrence_array)
+            ).astype(np.int64)
+            if self.animation is not None:
+                self.animation.note_changed_floors(passed["floor"][passed["boarded"] > 0].tolist())
+            self.record_index = record_index
+
+        current_floor = int(records["floor"][record_index]) if record_index >= 0 else 1
+
+        return current_floor, self.occurrence_array
+
+    def handle_events(self) -> bool:
+        """
+        Handles pending window events.
+
+        :return: Whether the window has been closed.
+        :rtype: bool
+        """
+        seek_distance = max(self.last_step // 20, 1)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return True
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    self.toggle_pause()
+                elif event.key == pygame.K_RIGHT:
+                    self.seek(self.position + seek_distance)
+                elif event.key == pygame.K_LEFT:
+                    self.seek(self.position - seek_distance)
+                elif event.key == pygame.K_UP:
+                    self.set_speed(self.steps_per_second * 2)
+                elif event.key == pygame.K_DOWN:
+                    self.set_speed(self.steps_per_second / 2)
+                elif event.key == pygame.K_HOME:
+                    self.seek(0)
+                elif event.key == pygame.K_END:
+                    self.seek(self.last_step)
+
+        return False
+
+    def play(self):
+        """ Opens a window and plays the trace until the window is closed. """
+        self.animation = create_animation(self.trace.number_of_floors)
+
+        while not self.handle_events():
+            seconds = self.animation.clock.tick(self.frame_rate) / 1000
+            if not self.is_paused:
+                self.seek(self.position + seconds * self.steps_per_second)
+
+            current_floor, occurrence_array = self.state_at(self.position)
+            self.animation.render(current_floor, occurrence_array)
+
+        self.animation.close()
+
+
+def play_trace(path: str, steps_per_second: float = None):
+    """
+    Plays back a trace file.
+
+    :param str path: The trace file to play.
+    :param float steps_per_second: How fast to play the run, defaults to None for one step per floor each second.
+    """
+    TracePlayer(Trace(path), steps_per_second).play()
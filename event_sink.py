@@ -0,0 +1,173 @@
+"""
+This module holds the sinks that simulation runs report to. A sink is
+either off, reports a summary of the statistics at the end of a run, or
+also reports every event: people getting in and out and the lift
+moving.
+
+The lifts only build an event when their sink records events, so with
+events off the simulation does no formatting or I/O at all.
+"""
+import csv
+import sys
+
+# Reporting levels.
+OFF = 0
+SUMMARY = 1
+EVENTS = 2
+
+# The label and unit of each statistic, in the order the lifts return them.
+STATISTIC_LABELS = (
+    ("Number of Floors", "floors"),
+    ("Lifetime steps for lift", "steps"),
+    ("Total Time Waiting for Lift", "steps"),
+    ("Total Time in Lift", "steps"),
+    ("Number of People", "people"),
+    ("Average Wait Time", "steps per person"),
+    ("Average Time in Lift", "steps per person")
+)
+
+
+class EventSink:
+    """
+    A sink that discards everything reported to it. Subclasses override
+    the methods for the reports they keep.
+
+    :param int level: The reporting level, one of OFF, SUMMARY or EVENTS, defaults to OFF.
+    """
+
+    def __init__(self, level: int = OFF):
+        """ EventSink Constructor. """
+        self.level = level
+
+    @property
+    def records_events(self) -> bool:
+        """ Whether every event should be reported. """
+        return self.level >= EVENTS
+
+    @property
+    def records_summary(self) -> bool:
+        """ Whether the statistics at the end of a run should be reported. """
+        return self.level >= SUMMARY
+
+    def boarded(self, step: int, person: int, floor: int):
+        """
+        Reports a person getting in the lift.
+
+        :param int step: The step the person got in on.
+        :param int person: The row of the person.
+        :param int floor: The floor the person got in on.
+        """
+
+    def alighted(self, step: int, person: int, floor: int, start_floor: int):
+        """
+        Reports a person getting out of the lift.
+
+        :param int step: The step the person got out on.
+        :param int person: The row of the person.
+        :param int floor: The floor the person got out on.
+        :param int start_floor: The floor the person got in on.
+        """
+
+    def moved(self, step: int, floor: int, direction: str):
+        """
+        Reports the lift arriving on a floor.
+
+        :param int step: The step the lift arrived on.
+        :param int floor: The floor the lift is on.
+        :param str direction: The direction the lift is moving in.
+        """
+
+    def summary(self, title: str, statistics: tuple, distributions: dict = None):
+        """
+        Reports the statistics at the end of a run.
+
+        :param str title: What finished, or None for no title.
+        :param tuple statistics: The statistics of the run, in the order of STATISTIC_LABELS.
+        :param dict distributions: The mean, percentiles and maximum of each time, by name, defaults to None.
+        """
+
+    def close(self):
+        """ Finishes reporting. """
+
+
+class PrintSink(EventSink):
+    """
+    A sink that prints reports for a person to read.
+
+    :param int level: The reporting level, defaults to SUMMARY.
+    :param file: Where to print to, defaults to None for standard output.
+    """
+
+    def __init__(self, level: int = SUMMARY, file=None):
+        """ PrintSink Constructor. """
+        super().__init__(level)
+        self.file = file
+
+    def boarded(self, step: int, person: int, floor: int):
+        """ Prints a person getting in the lift. """
+        print("Got in lift at", floor, file=self.file or sys.stdout)
+
+    def alighted(self, step: int, person: int, floor: int, start_floor: int):
+        """ Prints a person getting out of the lift. """
+        print("Arrived at floor", floor, "from floor", start_floor, file=self.file or sys.stdout)
+
+    def moved(self, step: int, floor: int, direction: str):
+        """ Prints the lift arriving on a floor. """
+        print("Currently on floor", floor, "moving", direction, file=self.file or sys.stdout)
+
+    def summary(self, title: str, statistics: tuple, distributions: dict = None):
+        """ Prints the statistics at the end of a run. """
+        file = self.file or sys.stdout
+        if title:
+            print(title + "\n", file=file)
+
+        for (label, unit), value in zip(STATISTIC_LABELS, statistics):
+            print(label + ":", value, unit + ".", file=file)
+
+        for label, distribution in (distributions or {}).items():
+            print(label + ":", ", ".join(name + " " + str(value) for name, value in distribution.items()),
+                  "steps.", file=file)
+
+
+class StreamSink(EventSink):
+    """
+    A sink that writes reports as rows of a tab separated file, through a
+    large write buffer. Each row is the kind of report, the step and the
+    report's fields.
+
+    :param str path: The file to write to.
+    :param int level: The reporting level, defaults to EVENTS.
+    :param int buffer_size: The size of the write buffer in bytes, defaults to 1 MiB.
+    """
+
+    def __init__(self, path: str, level: int = EVENTS, buffer_size: int = 1 << 20):
+        """ StreamSink Constructor. """
+        super().__init__(level)
+        self.file = open(path, "w", newline="", buffering=buffer_size)
+        self.writer = csv.writer(self.file, delimiter="\t")
+        self.writer.writerow(("kind", "step", "person", "floor", "detail"))
+
+    def boarded(self, step: int, person: int, floor: int):
+        """ Writes a person getting in the lift. """
+        self.writer.writerow(("board", step, person, floor, ""))
+
+    def alighted(self, step: int, person: int, floor: int, start_floor: int):
+        """ Writes a person getting out of the lift, with the floor they got in on. """
+        self.writer.writerow(("alight", step, person, floor, start_floor))
+
+    def moved(self, step: int, floor: int, direction: str):
+        """ Writes the lift arriving on a floor, with its direction. """
+        self.writer.writerow(("move", step, "", floor, direction))
+
+    def summary(self, title: str, statistics: tuple, distributions: dict = None):
+        """ Writes the statistics at the end of a run, one row each. """
+        for (label, _), value in zip(STATISTIC_LABELS, statistics):
+            self.writer.writerow(("summary", "", "", "", label + "=" + str(value)))
+
+        for label, distribution in (distributions or {}).items():
+            for name, value in distribution.items():
+                self.writer.writerow(("summary", "", "", "", label + " " + name + "=" + str(value)))
+
+    def close(self):
+        """ Flushes and closes the file. """
+        self.file.close()
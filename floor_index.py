@@ -0,0 +1,355 @@
+"""
+This module holds the structures both lift algorithms use to find
+people by floor, so that each step only looks at the people on the
+lift's current floor rather than everyone in the building.
+"""
+import numpy as np
+from population import Population, UP, DOWN
+
+DIRECTION_CODES = {"up": UP, "down": DOWN}
+
+
+class FenwickTree:
+    """
+    A Fenwick (binary indexed) tree over a count per floor. Changing a
+    count, summing the counts up to a floor and finding the floor where a
+    running total is reached all take O(log F) time.
+
+    :param list counts: The starting count for each floor, indexed by floor. Index 0 is unused.
+    """
+
+    def __init__(self, counts: list):
+        """ FenwickTree Constructor. """
+        self.size = len(counts) - 1
+        self.tree = [0] + list(counts[1:])
+        self.total = sum(self.tree)
+
+        # Build in O(F) by pushing each node's total up to its parent.
+        for index in range(1, self.size + 1):
+            parent = index + (index & -index)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[index]
+
+        self.top_bit = 1
+        while self.top_bit * 2 <= self.size:
+            self.top_bit *= 2
+
+    def add(self, index: int, amount: int):
+        """
+        Adds an amount to the count of a floor.
+
+        :param int index: The floor to change.
+        :param int amount: The amount to add, negative to remove.
+        """
+        self.total += amount
+        while index <= self.size:
+            self.tree[index] += amount
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """
+        Returns the total count of every floor up to and including a given floor.
+
+        :param int index: The highest floor to include.
+
+        :return: The total count.
+        :rtype: int
+        """
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+
+        return total
+
+    def find(self, total: int) -> int:
+        """
+        Returns the lowest floor where the running total reaches a given total.
+
+        :param int total: The running total to reach, at least 1.
+
+        :return: The lowest floor whose prefix sum is at least the total.
+        :rtype: int
+        """
+        index = 0
+        bit = self.top_bit
+        while bit:
+            if index + bit <= self.size and self.tree[index + bit] < total:
+                index += bit
+                total -= self.tree[index]
+            bit //= 2
+
+        return index + 1
+
+    def next_above(self, index: int):
+        """
+        Returns the nearest floor above a given floor with a count.
+
+        :param int index: The floor to search above.
+
+        :return: The nearest floor above with a count, or None if there is none.
+        :rtype: int
+        """
+        total_up_to_index = self.prefix_sum(index)
+        if total_up_to_index == self.total:
+            return None
+
+        return self.find(total_up_to_index + 1)
+
+    def next_below(self, index: int):
+        """
+        Returns the nearest floor below a given floor with a count.
+
+        :param int index: The floor to search below.
+
+        :return: The nearest floor below with a count, or None if there is none.
+        :rtype: int
+        """
+        total_below_index = self.prefix_sum(index - 1)
+        if total_below_index == 0:
+            return None
+
+        return self.find(total_below_index)
+
+    def highest(self):
+        """
+        Returns the highest floor with a count.
+
+        :return: The highest floor with a count, or None if every count is 0.
+        :rtype: int
+        """
+        if not self.total:
+            return None
+
+        return self.find(self.total)
+
+    def lowest(self):
+        """
+        Returns the lowest floor with a count.
+
+        :return: The lowest floor with a count, or None if every count is 0.
+        :rtype: int
+        """
+        if not self.total:
+            return None
+
+        return self.find(1)
+
+
+class WaitingQueues:
+    """
+    Indexes the people waiting for the lift by their start floor and the
+    direction they want to travel in. People on the same floor are queued
+    in the order they appear in the population.
+
+    Everyone is sorted into their queue once, up front; each queue is then
+    a slice of a single array with a pointer to the person at its front.
+
+    :param int number_of_floors: The total number of floors in the building.
+    :param Population population: Everyone waiting for the lift.
+    :param list floor_counts: The number of people on each floor, indexed by floor, defaults to None to count them.
+    """
+
+    def __init__(self, number_of_floors: int, population: Population, floor_counts: list = None):
+        """ WaitingQueues Constructor. """
+        queue_numbers = population.start_floor.astype(np.int64) * 2 + population.direction
+        queue_sizes = np.bincount(queue_numbers, minlength=(number_of_floors + 1) * 2)
+
+        self.people = np.argsort(queue_numbers, kind="stable").astype(np.int32)
+        self.queue_ends = np.cumsum(queue_sizes).tolist()
+        self.queue_fronts = [0] + self.queue_ends[:-1]
+        if floor_counts is None:
+            floor_counts = np.bincount(population.start_floor, minlength=number_of_floors + 1).tolist()
+
+        self.floor_counts = FenwickTree(floor_counts)
+        self.total_waiting = len(population)
+
+    def __len__(self) -> int:
+        """ The number of people still waiting. """
+        return self.total_waiting
+
+    def count(self, floor: int, direction: str = None) -> int:
+        """
+        Returns the number of people waiting on a floor.
+
+        :param int floor: The floor to count.
+        :param str direction: Only count people going this way, defaults to None for both directions.
+
+        :return: The number of people waiting on that floor.
+        :rtype: int
+        """
+        if direction is None:
+            return self.count(floor, "up") + self.count(floor, "down")
+
+        queue_number = floor * 2 + DIRECTION_CODES[direction]
+        return self.queue_ends[queue_number] - self.queue_fronts[queue_number]
+
+    def pop_person(self, floor: int, direction: str = None) -> int:
+        """
+        Removes and returns the person at the front of the queue on a floor.
+
+        If no direction is given, the person who comes first in the
+        population in either direction is taken.
+
+        :param int floor: The floor to take the person from.
+        :param str direction: The direction of the queue, defaults to None for either direction.
+
+        :return: The row of the person at the front of the queue.
+        :rtype: int
+        """
+        if direction is None:
+            up_front = self.queue_fronts[floor * 2 + UP]
+            down_front = self.queue_fronts[floor * 2 + DOWN]
+            if not self.count(floor, "down") or \
+                    (self.count(floor, "up") and self.people[up_front] < self.people[down_front]):
+                direction = "up"
+            else:
+                direction = "down"
+
+        queue_number = floor * 2 + DIRECTION_CODES[direction]
+        person = int(self.people[self.queue_fronts[queue_number]])
+        self.queue_fronts[queue_number] += 1
+        self.total_waiting -= 1
+        self.floor_counts.add(floor, -1)
+
+        return person
+
+    def next_floor_above(self, floor: int):
+        """
+        Returns the nearest floor above a given floor with anyone waiting.
+
+        :param int floor: The floor to search above.
+
+        :return: The nearest floor above with people waiting, or None if there is none.
+        :rtype: int
+        """
+        return self.floor_counts.next_above(floor)
+
+    def next_floor_below(self, floor: int):
+        """
+        Returns the nearest floor below a given floor with anyone waiting.
+
+        :param int floor: The floor to search below.
+
+        :return: The nearest floor below with people waiting, or None if there is none.
+        :rtype: int
+        """
+        return self.floor_counts.next_below(floor)
+
+    def highest_floor(self):
+        """
+        Returns the highest floor with anyone waiting.
+
+        :return: The highest floor with people waiting, or None if nobody is waiting.
+        :rtype: int
+        """
+        return self.floor_counts.highest()
+
+    def lowest_floor(self):
+        """
+        Returns the lowest floor with anyone waiting.
+
+        :return: The lowest floor with people waiting, or None if nobody is waiting.
+        :rtype: int
+        """
+        return self.floor_counts.lowest()
+
+
+class DestinationCounts:
+    """
+    The people in the lift, indexed by the floor they are getting off on.
+    Finding who gets off on a floor, and the nearest floor anyone is
+    getting off on, never looks at the other people in the lift.
+
+    :param int number_of_floors: The total number of floors in the building.
+    """
+
+    def __init__(self, number_of_floors: int):
+        """ DestinationCounts Constructor. """
+        self.people_by_floor = {}
+        self.floor_counts = FenwickTree([0] * (number_of_floors + 1))
+
+    def __len__(self) -> int:
+        """ The number of people in the lift. """
+        return self.floor_counts.total
+
+    def __iter__(self):
+        """ Iterates over the rows of everyone in the lift. """
+        for people in self.people_by_floor.values():
+            yield from people
+
+    def add_person(self, person: int, target_floor: int):
+        """
+        Adds a person to the lift.
+
+        :param int person: The row of the person.
+        :param int target_floor: The floor the person gets off on.
+        """
+        self.people_by_floor.setdefault(target_floor, []).append(person)
+        self.floor_counts.add(target_floor, 1)
+
+    def count(self, floor: int) -> int:
+        """
+        Returns the number of people getting off on a floor.
+
+        :param int floor: The floor to count.
+
+        :return: The number of people getting off on that floor.
+        :rtype: int
+        """
+        return len(self.people_by_floor.get(floor, ()))
+
+    def remove_people_on_floor(self, floor: int) -> list:
+        """
+        Removes and returns everyone getting off on a floor.
+
+        :param int floor: The floor the lift is on.
+
+        :return: The rows of the people getting off, in the order they got in.
+        :rtype: list
+        """
+        people = self.people_by_floor.pop(floor, [])
+        if people:
+            self.floor_counts.add(floor, -len(people))
+
+        return people
+
+    def next_floor_above(self, floor: int):
+        """
+        Returns the nearest floor above a given floor that anyone is getting off on.
+
+        :param int floor: The floor to search above.
+
+        :return: The nearest destination above, or None if there is none.
+        :rtype: int
+        """
+        return self.floor_counts.next_above(floor)
+
+    def next_floor_below(self, floor: int):
+        """
+        Returns the nearest floor below a given floor that anyone is getting off on.
+
+        :param int floor: The floor to search below.
+
+        :return: The nearest destination below, or None if there is none.
+        :rtype: int
+        """
+        return self.floor_counts.next_below(floor)
+
+    def highest_floor(self):
+        """
+        Returns the highest floor anyone is getting off on.
+
+        :return: The highest destination, or None if the lift is empty.
+        :rtype: int
+        """
+        return self.floor_counts.highest()
+
+    def lowest_floor(self):
+        """
+        Returns the lowest floor anyone is getting off on.
+
+        :return: The lowest destination, or None if the lift is empty.
+        :rtype: int
+        """
+        return self.floor_counts.lowest()
@@ -1,75 +1,80 @@
 import naive_algorithm as naive
 import improved_algorithm as improved
+import monte_carlo
+import result_cache
+import sweep
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
-from copy import deepcopy
+from population import generate_scenario
 
 
-def create_people_list(number_of_floors: int, population: int):
-    people_list = improved.generate_people(number_of_floors, population)
+def create_people_list(number_of_floors: int, population: int, seed=None):
+    people_list = generate_scenario(number_of_floors, population, seed)
 
     return people_list
 
 
-def get_stats_for_both(number_of_floors: int, population: int):
-    people_list = create_people_list(number_of_floors, population)
+def get_stats_for_both(number_of_floors: int, population: int, seed=None):
+    people_list = create_people_list(number_of_floors, population, seed)
 
     number_of_floors_n, life_steps_n, total_wait_n, total_time_naive_n, max_people_n, avg_wait_n, avg_in_lift_n = \
-        naive.naive_lift_algorithm(number_of_floors, deepcopy(people_list), True)
+        naive.naive_lift_algorithm(number_of_floors, people_list, True, animate=False)
 
     number_of_floors_i, life_steps_i, total_wait_i, total_time_naive_i, max_people_i, avg_wait_i, avg_in_lift_i = \
-        improved.better_lift_algorithm(number_of_floors, population, deepcopy(people_list))
+        improved.better_lift_algorithm(number_of_floors, population, people_list, animate=False)
 
     print(number_of_floors_n, life_steps_n, total_wait_n, total_time_naive_n, max_people_n, avg_wait_n, avg_in_lift_n)
     print(number_of_floors_i, life_steps_i, total_wait_i, total_time_naive_i, max_people_i, avg_wait_i, avg_in_lift_i)
 
 
-def both_graphs():
-    lower_limit = 21
-    upper_limit = 50
-    avg_wait_array_n = []
-    number_floor_array_n = []
+def both_graphs(floor_counts=range(21, 51), people_per_floor: int = 3, number_of_replications: int = 100,
+                processes: int = None, seed: int = 0, cache_path: str = "lift_results.sqlite"):
+    floor_counts = list(floor_counts)
+    points = [(number_of_floors, number_of_floors * people_per_floor) for number_of_floors in floor_counts]
+    root_seed = np.random.SeedSequence(seed)
+    print("Sweep seed:", root_seed.entropy)
+    jobs = sweep.make_jobs(points, sweep.ALGORITHM_NAMES, number_of_replications, root_seed)
 
-    avg_wait_array_i = []
-    number_floor_array_i = []
+    cache = result_cache.ResultCache(cache_path) if cache_path else None
+    results = sweep.run_sweep(jobs, processes, cache)
+    if cache is not None:
+        cache.close()
 
-    for simulation in range(lower_limit, upper_limit + 1, 1):
-        people_list = create_people_list(simulation, simulation * 3)
+    avg_wait_array = {"naive": [], "improved": []}
+    error_array = {"naive": [], "improved": []}
+    number_floor_array = {"naive": [], "improved": []}
 
-        number_of_floors_n, life_steps, total_wait, total_time_naive, max_people, avg_wait_n, avg_in_lift = \
-            naive.naive_lift_algorithm(simulation, deepcopy(people_list), True)
+    for job, statistics in zip(jobs, results):
+        mean_wait, half_width = monte_carlo.mean_confidence_interval(statistics[5])
+        avg_wait_array[job.algorithm].append(mean_wait)
+        error_array[job.algorithm].append(half_width)
+        number_floor_array[job.algorithm].append(job.number_of_floors)
 
-        avg_wait_array_n.append(avg_wait_n)
-        number_floor_array_n.append(simulation)
-
-        number_of_floors_i, life_steps, total_wait, total_time_naive, max_people, avg_wait_i, avg_in_lift = \
-            improved.better_lift_algorithm(simulation, simulation * 3, deepcopy(people_list))
-
-        avg_wait_array_i.append(avg_wait_i)
-        number_floor_array_i.append(simulation)
+    avg_wait_array_n, number_floor_array_n = avg_wait_array["naive"], number_floor_array["naive"]
+    avg_wait_array_i, number_floor_array_i = avg_wait_array["improved"], number_floor_array["improved"]
 
     print(avg_wait_array_n)
     print(avg_wait_array_i)
     print(number_floor_array_n)
     print(number_floor_array_i)
 
-    plt.plot(number_floor_array_i, avg_wait_array_i, "bx")
+    plt.errorbar(number_floor_array_i, avg_wait_array_i, yerr=error_array["improved"], fmt="bx")
     plt.xlabel("Number of Floors")
     plt.title("Number of Floors against Average Wait Time for the Better Algorithm")
     plt.ylabel("Average Wait Time")
-    plt.axis([21, 50, 0, 1000])
+    plt.axis([min(floor_counts), max(floor_counts), 0, 1000])
     coefficients = np.polyfit(number_floor_array_i, avg_wait_array_i, 1)
     best_fit = np.poly1d(coefficients)
     plt.plot(number_floor_array_i, best_fit(number_floor_array_i), "r")
     plt.savefig("better_algo_150_people")
     plt.show()
 
-    plt.plot(number_floor_array_n, avg_wait_array_n, "bx")
+    plt.errorbar(number_floor_array_n, avg_wait_array_n, yerr=error_array["naive"], fmt="bx")
     plt.xlabel("Number of Floors")
     plt.title("Number of Floors against Average Wait Time for the Naïve Algorithm")
     plt.ylabel("Average Wait Time")
-    plt.axis([21, 50, 0, 1000])
+    plt.axis([min(floor_counts), max(floor_counts), 0, 1000])
     coefficients = np.polyfit(number_floor_array_n, avg_wait_array_n, 1)
     best_fit = np.poly1d(coefficients)
     plt.plot(number_floor_array_n, best_fit(number_floor_array_n), "r")
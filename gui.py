@@ -4,7 +4,10 @@ import improved_algorithm as improved
 import naive_algorithm as naive
 from pygame.sprite import Sprite
 from enum import Enum
-from multiprocessing import Pool
+from multiprocessing import Manager, Pool
+from queue import Empty
+from progress import ProgressReporter
+from run_context import RunContext
 
 # ================ GUI Constants ================
 WHITE = (255, 255, 255)
@@ -14,6 +17,15 @@ LAST_NUMBER_SELECT = 2
 LAST_POP_SELECT = 1
 CANVAS = 0
 
+# ================ Worker Pool ================
+# Started with the GUI and reused for every run, so a run starts
+# without spawning a process first. Runs report their progress on
+# the queue, and are cancelled by setting the event.
+LIFT_POOL = None
+LIFT_MANAGER = None
+PROGRESS_QUEUE = None
+CANCEL_EVENT = None
+
 # ================ Stat Constants ================
 FLOOR_NUM = 0
 LIFE_STEPS = 0
@@ -645,12 +657,186 @@ def people_select(canvas):
         pygame.display.flip()
 
 
-def run_improved():
+def warm_up_worker():
+    """
+    Imports the animation in a pool worker as it starts, so that the
+    first run does not wait on pygame being loaded.
+    """
+    import animation
+
+
+def start_lift_pool():
+    """
+    Starts the worker pool that lift runs are sent to,
+    and the queue and event used to follow and cancel them.
+    """
+    global LIFT_POOL
+    global LIFT_MANAGER
+    global PROGRESS_QUEUE
+    global CANCEL_EVENT
+
+    LIFT_POOL = Pool(processes=1, initializer=warm_up_worker)
+    LIFT_MANAGER = Manager()
+    PROGRESS_QUEUE = LIFT_MANAGER.Queue()
+    CANCEL_EVENT = LIFT_MANAGER.Event()
+
+
+def stop_lift_pool():
+    """
+    Stops the worker pool, waiting for its worker to exit.
+    """
+    global LIFT_POOL
+    global LIFT_MANAGER
+
+    if LIFT_POOL is not None:
+        LIFT_POOL.close()
+        LIFT_POOL.join()
+        LIFT_POOL = None
+
+    if LIFT_MANAGER is not None:
+        LIFT_MANAGER.shutdown()
+        LIFT_MANAGER = None
+
+
+def format_time_left(time_left):
     """
-        Runs the improved algorithm in a separate process pool,
-        and returns any variables in a 3D array.
+    Formats the estimated time left in a run for the progress screen.
+
+    :param float time_left: The seconds left, or None if not yet known.
+    :return: The time left as a string.
+    :rtype: str
+    """
+    if time_left is None:
+        return "Estimating time left..."
+
+    minutes, seconds = divmod(int(time_left + 0.5), 60)
+    if minutes:
+        return "About " + str(minutes) + " min " + str(seconds) + " s left"
+
+    return "About " + str(seconds) + " s left"
+
+
+def run_lift_job(canvas, title: str, lift_function, args: tuple):
+    """
+    Sends a run to the worker pool, then shows its progress
+    until it finishes. The screen keeps responding while the
+    run goes on, and the run is cancelled by the Cancel button
+    or by closing the window.
+
+    :param Canvas canvas: Canvas onto which progress is drawn.
+    :param str title: The title of the progress screen.
+    :param lift_function: The lift algorithm to run.
+    :param tuple args: The arguments to run the lift algorithm with.
+    :return: The statistics of the run, or None if it was cancelled, and
+    the state to move to: Stats, or Menu or Quit if it was cancelled.
+    :rtype: tuple
+    """
+    # Clear out anything left over from an earlier run.
+    CANCEL_EVENT.clear()
+    while True:
+        try:
+            PROGRESS_QUEUE.get_nowait()
+        except Empty:
+            break
+
+    context = RunContext(progress=ProgressReporter(PROGRESS_QUEUE, LAST_POP_SELECT, CANCEL_EVENT))
+    lift_job = LIFT_POOL.apply_async(lift_function, args, {"context": context})
+
+    cancel_button = ButtonElement(
+        centre_pos=(400, 500),
+        size=30,
+        bg_col=WHITE,
+        font_col=BLACK,
+        string="Cancel",
+        action=GameState.MENU
+    )
 
-        :return: An enum for the Stats screen state.
+    title_label = LabelElement(
+        centre_pos=(400, 150),
+        size=40,
+        bg_col=WHITE,
+        font_col=BLACK,
+        string=title
+    )
+
+    progress = (0, 0, LAST_POP_SELECT, None)
+    progress_labels = []
+    game_state = GameState.STATS
+    is_cancelled = False
+    clock = pygame.time.Clock()
+
+    while not lift_job.ready():
+        mouse_up = False
+        for event in pygame.event.get():
+            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                mouse_up = True
+            elif event.type == pygame.QUIT:
+                game_state = GameState.QUIT
+
+        # Only the latest report is shown.
+        latest = progress
+        while True:
+            try:
+                latest = PROGRESS_QUEUE.get_nowait()
+            except Empty:
+                break
+
+        if latest != progress or not progress_labels:
+            progress = latest
+            step, delivered, number_of_people, time_left = progress
+            progress_strings = [
+                "Steps: " + str(step),
+                "Delivered: " + str(delivered) + " of " + str(number_of_people),
+                format_time_left(time_left)
+            ]
+            progress_labels = [
+                LabelElement(centre_pos=(400, 250 + 50 * row), size=30, bg_col=WHITE, font_col=BLACK, string=string)
+                for row, string in enumerate(progress_strings)
+            ]
+
+        canvas.fill(WHITE)
+
+        if not is_cancelled and game_state == GameState.STATS:
+            action = cancel_button.update(pygame.mouse.get_pos(), mouse_up)
+            if action is not None:
+                game_state = action
+
+        # The run is left to finish early, so the worker is free for the next one.
+        if not is_cancelled and game_state != GameState.STATS:
+            CANCEL_EVENT.set()
+            is_cancelled = True
+            title_label = LabelElement(
+                centre_pos=(400, 150),
+                size=40,
+                bg_col=WHITE,
+                font_col=BLACK,
+                string="Cancelling..."
+            )
+
+        if not is_cancelled:
+            cancel_button.draw(canvas)
+
+        title_label.draw(canvas)
+        for label in progress_labels:
+            label.draw(canvas)
+
+        pygame.display.flip()
+        clock.tick(30)
+
+    result = lift_job.get()
+    if is_cancelled:
+        return None, game_state
+
+    return result, game_state
+
+
+def run_improved(canvas):
+    """
+        Runs the improved algorithm in the worker pool, showing
+        its progress, and returns any variables in a 3D array.
+
+        :param Canvas canvas: Canvas onto which progress is drawn.
+        :return: An enum for the Stats screen state, or the Menu or Quit state if cancelled.
         :rtype: enum
     """
     global LAST_POP_SELECT
@@ -665,33 +851,36 @@ def run_improved():
     global AVG_IN_LIFT
 
     people_list = improved.generate_people(LAST_NUMBER_SELECT, LAST_POP_SELECT)
-    lift_job = Pool(processes=1)
 
-    result = lift_job.starmap(
-        improved.better_lift_algorithm, [(LAST_NUMBER_SELECT, LAST_POP_SELECT, people_list)]
+    result, game_state = run_lift_job(
+        canvas, "Running Improved Lift", improved.better_lift_algorithm,
+        (LAST_NUMBER_SELECT, LAST_POP_SELECT, people_list)
     )
-    lift_job.close()
-
-    FLOOR_NUM = result[0][0]
-    LIFE_STEPS = result[0][1]
-    TOTAL_WAIT = result[0][2]
-    TOTAL_IN_LIFT = result[0][3]
-    POPULATION = result[0][4]
-    AVG_WAIT = result[0][5]
-    AVG_IN_LIFT = result[0][6]
 
     LAST_NUMBER_SELECT = 2
     LAST_POP_SELECT = 1
     KEEP_SELECT = False
+    if result is None:
+        return game_state
+
+    FLOOR_NUM = result[0]
+    LIFE_STEPS = result[1]
+    TOTAL_WAIT = result[2]
+    TOTAL_IN_LIFT = result[3]
+    POPULATION = result[4]
+    AVG_WAIT = result[5]
+    AVG_IN_LIFT = result[6]
+
     return GameState.STATS
 
 
-def run_naive():
+def run_naive(canvas):
     """
-    Runs the Naïve algorithm in a separate process pool,
-    and returns any variables in a 3D array.
+    Runs the Naïve algorithm in the worker pool, showing
+    its progress, and returns any variables in a 3D array.
 
-    :return: An enum for the Stats screen state.
+    :param Canvas canvas: Canvas onto which progress is drawn.
+    :return: An enum for the Stats screen state, or the Menu or Quit state if cancelled.
     :rtype: enum
     """
     global LAST_POP_SELECT
@@ -706,24 +895,25 @@ def run_naive():
     global AVG_IN_LIFT
 
     people_list = improved.generate_people(LAST_NUMBER_SELECT, LAST_POP_SELECT)
-    lift_job = Pool(processes=1)
 
-    result = lift_job.starmap(
-        naive.naive_lift_algorithm, [(LAST_NUMBER_SELECT, people_list, True)]
+    result, game_state = run_lift_job(
+        canvas, "Running Naïve Lift", naive.naive_lift_algorithm, (LAST_NUMBER_SELECT, people_list, True)
     )
-    lift_job.close()
-
-    FLOOR_NUM = result[0][0]
-    LIFE_STEPS = result[0][1]
-    TOTAL_WAIT = result[0][2]
-    TOTAL_IN_LIFT = result[0][3]
-    POPULATION = result[0][4]
-    AVG_WAIT = result[0][5]
-    AVG_IN_LIFT = result[0][6]
 
     LAST_NUMBER_SELECT = 2
     LAST_POP_SELECT = 1
     KEEP_SELECT = False
+    if result is None:
+        return game_state
+
+    FLOOR_NUM = result[0]
+    LIFE_STEPS = result[1]
+    TOTAL_WAIT = result[2]
+    TOTAL_IN_LIFT = result[3]
+    POPULATION = result[4]
+    AVG_WAIT = result[5]
+    AVG_IN_LIFT = result[6]
+
     return GameState.STATS
 
 
@@ -1015,6 +1205,8 @@ def main():
     Controls which state the GUI is in and what to
     do when changing states.
     """
+    # The pool is started before pygame, so its worker never inherits an open display.
+    start_lift_pool()
     pygame.init()
     is_done = False
 
@@ -1036,10 +1228,10 @@ def main():
             game_state = people_select(canvas)
 
         if game_state == GameState.IMPROVED:
-            game_state = run_improved()
+            game_state = run_improved(canvas)
 
         if game_state == GameState.NAIVE:
-            game_state = run_naive()
+            game_state = run_naive(canvas)
 
         if game_state == GameState.STATS:
             canvas = pygame.display.set_mode((800, 600))
@@ -1047,6 +1239,7 @@ def main():
 
         if game_state == GameState.QUIT:
             pygame.quit()
+            stop_lift_pool()
             is_done = True
 
 
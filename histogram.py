@@ -0,0 +1,126 @@
+"""
+This module holds a fixed size histogram of step counts, used to report
+the spread of wait and ride times as a run goes, without keeping a time
+for every person.
+"""
+
+PERCENTILES = (50, 90, 99)
+
+
+class StepHistogram:
+    """
+    A log-linear histogram of non-negative step counts.
+
+    Counts below 2 ** significant_bits each get their own bucket and are
+    exact. Above that, every power of two is split into 2 ** (significant_bits - 1)
+    buckets, so a percentile is never out by more than one part in
+    2 ** (significant_bits - 1). The number of buckets is fixed up front.
+
+    :param int significant_bits: The number of bits of each count kept exactly, defaults to 7.
+    :param int max_bits: The number of bits in the largest count that can be recorded, defaults to 48.
+    """
+
+    def __init__(self, significant_bits: int = 7, max_bits: int = 48):
+        """ StepHistogram Constructor. """
+        self.significant_bits = significant_bits
+        self.exact_count = 1 << significant_bits
+        self.half_count = self.exact_count >> 1
+        self.buckets = [0] * (self.exact_count + (max_bits - significant_bits) * self.half_count)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def __len__(self) -> int:
+        """ The number of counts recorded. """
+        return self.count
+
+    def bucket_index(self, value: int) -> int:
+        """
+        Returns the bucket a count falls in.
+
+        :param int value: The count.
+
+        :return: The index of its bucket.
+        :rtype: int
+        """
+        if value < self.exact_count:
+            return value
+
+        shift = value.bit_length() - self.significant_bits
+        return self.exact_count + (shift - 1) * self.half_count + (value >> shift) - self.half_count
+
+    def bucket_highest(self, index: int) -> int:
+        """
+        Returns the highest count that falls in a bucket.
+
+        :param int index: The index of the bucket.
+
+        :return: The highest count in the bucket.
+        :rtype: int
+        """
+        if index < self.exact_count:
+            return index
+
+        shift, offset = divmod(index - self.exact_count, self.half_count)
+        shift += 1
+        return ((self.half_count + offset + 1) << shift) - 1
+
+    def record(self, value: int):
+        """
+        Records a count.
+
+        :param int value: The count, at least 0.
+        """
+        self.buckets[self.bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        """
+        Returns the mean of every count recorded.
+
+        :return: The mean, or 0 if nothing has been recorded.
+        :rtype: float
+        """
+        if not self.count:
+            return 0.0
+
+        return self.total / self.count
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the count that a given percentage of the recorded counts are at or below.
+
+        :param float percent: The percentage, from 0 to 100.
+
+        :return: The highest count in the bucket the percentile falls in, never more than the
+        largest count recorded, or 0 if nothing has been recorded.
+        :rtype: int
+        """
+        if not self.count:
+            return 0
+
+        # The rank of the percentile, counting from 1.
+        rank = max(1, -(-self.count * percent // 100))
+        running_total = 0
+        for index, bucket in enumerate(self.buckets):
+            running_total += bucket
+            if running_total >= rank:
+                return min(self.bucket_highest(index), self.max)
+
+        return self.max
+
+    def summary(self) -> dict:
+        """
+        Returns the mean, percentiles and maximum of the recorded counts.
+
+        :return: mean, p50, p90, p99 and max.
+        :rtype: dict
+        """
+        summary = {"mean": round(self.mean(), 2)}
+        summary.update(("p" + str(percent), self.percentile(percent)) for percent in PERCENTILES)
+        summary["max"] = self.max
+
+        return summary
@@ -1,8 +1,8 @@
 """
 This module simulates an improved algorithm for a single car
 lift system. Each lift has a capacity of 6 people, with the
-simulation animating any scenario up to 20 floors. Any higher
-and the information will be relayed textually.
+simulation animating any scenario. Buildings above 20 floors
+are shown through a window that follows the lift.
 
 Created by 690037391
 01/2020 - 04/2020
@@ -12,94 +12,17 @@ Created by 690037391
 # Imports found below
 # ====================
 
-import random
-from copy import deepcopy
+import numpy as np
 from typing import Union
-import pygame
-import animation as animate
+from floor_index import DestinationCounts, WaitingQueues
+from population import Population, Scenario, UP, DOWN, generate_population
+from run_context import RunContext
 
 
 # ========================
 # Class definitions below
 # ========================
 
-class Person:
-    """
-    The Person class models a real life passenger of a lift.
-
-    :param int current_floor: The current floor of the person.
-    :param str direction_to_move: The direction in which the person is to move.
-    :param int target_floor: The floor which the person is to get off on.
-
-    """
-
-    def __init__(self, current_floor: int, direction_to_move: str,
-                 target_floor: int):
-        """ Person Constructor. """
-        self.start_floor = current_floor
-        self.direction_to_move = direction_to_move
-        self.target_floor = target_floor
-
-        self.wait_time = 0
-        self.time_in_lift = 0
-        self.current_state = "waiting"
-        self.all_states = ["waiting", "in lift", "arrived"]
-
-    def get_target_floor(self) -> int:
-        """
-        Returns the target floor.
-
-        :return: The floor on which the person will get off.
-        :rtype: int
-        """
-        return self.target_floor
-
-    def get_wait_time(self) -> int:
-        """
-        Returns the wait_time of person.
-
-        :return: The amount of time spent waiting for lift.
-        :rtype: int
-        """
-        return self.wait_time
-
-    def get_time_in_lift(self) -> int:
-        """
-        Returns the time_in_lift of person.
-
-        :return: The amount of time spent in the lift
-        :rtype: int
-        """
-        return self.time_in_lift
-
-    def increase_wait_time(self):
-        """ Increments the wait time by one. """
-        self.wait_time += 1
-
-    def increase_time_in_lift(self):
-        """ Increments time in lift by one. """
-        self.time_in_lift += 1
-
-    def change_state(self, new_state: str):
-        """
-        Changes the current state of a person.
-
-        :param str new_state: The new state that the person will change to.
-        """
-        if new_state in self.all_states:
-            self.current_state = new_state
-
-    def get_in_lift(self):
-        """ Sets state to in lift. """
-        self.change_state("in lift")
-        print("Got in lift at", self.start_floor)
-
-    def get_out_of_lift(self):
-        """ Sets state to arrived. """
-        self.change_state("arrived")
-        print("Arrived at floor", self.target_floor, "from floor", self.start_floor)
-
-
 class Lift:
     """
     Represents the lift.
@@ -117,7 +40,7 @@ class Lift:
         self.all_states = ["up", "down"]
         self.current_state = "up"
         self.capacity = 6
-        self.people_in_lift = []
+        self.people_in_lift = DestinationCounts(number_of_floors)
         self.lifetime_steps = 0
         self.time_switched = 0
 
@@ -177,25 +100,29 @@ class Lift:
         self.set_current_state("down")
         self.move_by_one_floor("down")
 
-    def add_person_to_lift(self, person: Person):
+    def add_person_to_lift(self, person: int, target_floor: int):
         """
         Adds a given person to the lift.
 
-        :param Person person: The person that will be added to the lift.
+        :param int person: The row of the person that will be added to the lift.
+        :param int target_floor: The floor the person will get off on.
         """
-        self.people_in_lift.append(person)
+        self.people_in_lift.add_person(person, target_floor)
         self.capacity -= 1
 
-    def remove_person_from_lift(self, person: Person):
+    def remove_people_on_floor(self, floor: int) -> list:
         """
-        Removes a given person from the lift.
+        Removes everyone getting off on a given floor from the lift.
+
+        :param int floor: The floor the lift is on.
 
-        :param Person person: The person that will be removed from the lift.
+        :return: The rows of the people that got off.
+        :rtype: list
         """
-        for people in self.people_in_lift:
-            if people == person:
-                self.people_in_lift.remove(people)
-                self.capacity += 1
+        people = self.people_in_lift.remove_people_on_floor(floor)
+        self.capacity += len(people)
+
+        return people
 
     def get_current_capacity(self) -> int:
         """
@@ -229,175 +156,69 @@ class Lift:
         """ Increments the lifetime steps of the lift. """
         self.lifetime_steps += 1
 
+    def move_by_floors(self, number_of_floors: int):
+        """
+        Moves the lift a number of floors in its current direction, taking one step per floor.
 
-# ================
-# Functions below
-# ================
-
-def initialize_animation(number_of_floors: int):
-    """
-    Initializes the animation of the lift.
-
-    :param int number_of_floors: The total number of floors in the building.
+        :param int number_of_floors: The number of floors to move.
+        """
+        if self.current_state == "up":
+            self.current_floor += number_of_floors
+        elif self.current_state == "down":
+            self.current_floor -= number_of_floors
 
-    :return: Variables used in animation of lift.
-    :rtype: Union[int, Canvas, Clock, tuple]
-    """
-    canvas_x, canvas_y = animate.calc_canvas_size(number_of_floors)
-    lift_width, lift_height = animate.calc_elevator_size(number_of_floors)
-    canvas = animate.canvas_init(canvas_x, canvas_y)
-    clock = pygame.time.Clock()
-    lift_x_coord = (canvas_x - lift_width) // 2
-    lift_y_coord = canvas_y - (lift_height + 10)
-    lift_colour = (60, 69, 82)
+        self.lifetime_steps += number_of_floors
 
-    return \
-        canvas_x, canvas_y, lift_width, lift_height, canvas, \
-        clock, lift_x_coord, lift_y_coord, lift_colour
 
+# ================
+# Functions below
+# ================
 
-def generate_people(number_of_floors: int, number_of_people: int) -> list:
+def generate_people(number_of_floors: int, number_of_people: int, seed=None) -> Population:
     """
     Creates a set number of people on random floors, with random
     target floors.
 
     :param int number_of_floors: The total number of floors.
     :param int number_of_people: The total number of people.
-    :return: An array containing Person objects.
-    :rtype: list
+    :param seed: A seed, SeedSequence or Generator to draw from, defaults to None for fresh entropy.
+    :return: The population of the building.
+    :rtype: Population
     """
-    list_of_people = []
-
-    for person in range(number_of_people):
-        random_floor = random.randint(1, number_of_floors)
-
-        if random_floor == number_of_floors:
-            random_direction = "down"
-        elif random_floor == 1:
-            random_direction = "up"
-        else:
-            random_direction = random.choice(["up", "down"])
+    return generate_population(number_of_floors, number_of_people, seed)
 
-        if random_direction == "up":
-            random_target = random.randint(random_floor + 1, number_of_floors)
-        elif random_direction == "down":
-            random_target = random.randint(1, random_floor - 1)
 
-        list_of_people.append(
-            Person(random_floor, random_direction, random_target))
-
-    return list_of_people
-
-
-def create_people_occurrence_list(people_list: list) -> list:
+def create_people_occurrence_list(population: Population, number_of_floors: int) -> list:
     """
-    Creates an array containing dictionaries. Dictionaries contain floor number
-    and how many people at that floor.
+    Creates an array containing the number of people on each floor,
+    indexed by floor number. Index 0 is unused.
 
-    :param list people_list: Array of all people in building.
+    :param Population population: All people in building.
+    :param int number_of_floors: The total number of floors.
 
-    :return: An array of dictionaries that contains floor number and people on floor.
+    :return: The number of people on each floor.
     :rtype: list
     """
+    return np.bincount(population.start_floor, minlength=number_of_floors + 1).tolist()
 
-    # Init empty lists and dicts.
-    list_of_floors = []
-    floor_occurrence_list = []
-    floor_occurrence = {}
-
-    # For every person in the list, add their start floor to the list.
-    for person in people_list:
-        list_of_floors.append(person.start_floor)
-
-    # For every floor in the list of floors, count how many times that
-    # floor occurs.
-    # Create a dictionary mapping floor number to number of occurrences.
-    # Finally, some floors are double counted. Iterate through, adding dicts
-    # not in the final list to it, erasing double counts.
-    for floor in list_of_floors:
-        no_of_floor = list_of_floors.count(floor)
-        floor_occurrence["floor_number"] = floor
-        floor_occurrence["occurrences"] = no_of_floor
-
-        floor_occurrence_list.append(deepcopy(floor_occurrence))
 
-    final_list_occurrences = []
-    for occurrence in floor_occurrence_list:
-        if occurrence not in final_list_occurrences:
-            final_list_occurrences.append(occurrence)
-
-    return final_list_occurrences
-
-
-def update_occurrence_list(occurrence_list: list, floor_number: int):
+def update_occurrence_list(occurrence_list: list, floor_number: int) -> list:
     """
-    Updates the occurrence array with the current number of
-    people on each floor.
+    Updates the occurrence array when a person leaves a floor.
 
-    :param list occurrence_list: Number of people on each floor as an array of dictionaries.
+    :param list occurrence_list: Number of people on each floor, indexed by floor.
     :param int floor_number: The floor which is being updated.
     """
-    for floor in occurrence_list:
-        if floor["floor_number"] == floor_number:
-            floor["occurrences"] = floor["occurrences"] - 1
-
-        if floor["occurrences"] == 0:
-            occurrence_list.remove(floor)
+    occurrence_list[floor_number] -= 1
 
     return occurrence_list
 
 
-def draw_people_on_floor(canvas, no_floors: int, lift_height: int,
-                         lift_x_coord: int, occurrence_array: list):
-    """
-    Counts the number of people on each floor and draws it onto the animation.
-
-    :param Canvas canvas: The canvas onto which animation is done.
-    :param int no_floors: The total number of floors.
-    :param int lift_height: The height in pixels of the lift.
-    :param int lift_x_coord: The X coordinate of the upper left corner of the lift.
-    :param list occurrence_array: Number of people on each floor as an array of dictionaries.
-    """
-    text_font = pygame.font.SysFont('comicsansms', 30)
-
-    for person in occurrence_array:
-        floor_number = int(person["floor_number"])
-        people_on_floor = str(person["occurrences"])
-
-        text_surface = text_font.render(people_on_floor, True, (0, 0, 0))
-        text_rectangle = text_surface.get_rect()
-        if lift_height == 60:
-            text_rectangle_x = lift_x_coord + 80
-        elif lift_height == 40:
-            text_rectangle_x = lift_x_coord + 60
-        else:
-            text_rectangle_x = lift_x_coord + 50
-
-        if floor_number == no_floors:
-            text_rectangle_y = 10 + (lift_height // 2)
-        elif floor_number == 1:
-            text_rectangle_y = \
-                (
-                        20 + (no_floors * lift_height) + ((no_floors - 1) * 3)
-                ) - (10 + (lift_height // 2))
-        else:
-            text_rectangle_y = \
-                (
-                        (12 + lift_height) +
-                        (
-                                (no_floors - floor_number) * (lift_height + 3)
-                        )
-                ) - 2 - (lift_height // 2)
-
-        text_rectangle.center = (text_rectangle_x, text_rectangle_y)
-        canvas.blit(text_surface, text_rectangle)
-
-
-def check_ahead(occurrence_array: list, lift: Lift) -> bool:
+def check_ahead(waiting_queues: WaitingQueues, lift: Lift) -> bool:
     """
     Checks if there is anyone that needs to be collected in the current direction the lift is travelling.
 
-    :param list occurrence_array: Number of people on each floor as an array of dictionaries.
+    :param WaitingQueues waiting_queues: Everyone waiting, by floor and direction.
     :param Lift lift: The Lift object that is being used.
 
     :return: Whether there are people ahead that need picking up.
@@ -407,25 +228,13 @@ def check_ahead(occurrence_array: list, lift: Lift) -> bool:
         if lift.check_if_at_top():
             return False
         else:
-            for floor in occurrence_array:
-                if floor["floor_number"] > lift.current_floor:
-                    return True
-                elif floor["floor_number"] < lift.current_floor:
-                    continue
-                else:
-                    return False
+            return waiting_queues.next_floor_above(lift.current_floor) is not None
 
     elif lift.current_state == "down":
         if lift.check_if_at_bottom():
             return False
         else:
-            for floor in occurrence_array:
-                if floor["floor_number"] < lift.current_floor:
-                    return True
-                elif floor["floor_number"] > lift.current_floor:
-                    continue
-                else:
-                    return False
+            return waiting_queues.next_floor_below(lift.current_floor) is not None
 
 
 def check_passengers(lift: Lift) -> bool:
@@ -437,192 +246,167 @@ def check_passengers(lift: Lift) -> bool:
     :return: Whether there is anyone in the lift that needs to be delivered in the current direction.
     :rtype: bool
     """
-    for people in lift.people_in_lift:
-        people: Person
-        if lift.current_state == "up":
-            if lift.check_if_at_top():
-                return False
-            elif people.target_floor > lift.current_floor:
-                return True
-            elif people.target_floor < lift.current_floor:
-                continue
-            else:
-                return False
-        elif lift.current_state == "down":
-            if lift.check_if_at_bottom():
-                return False
-            elif people.target_floor < lift.current_floor:
-                return True
-            elif people.target_floor > lift.current_floor:
-                continue
-            else:
-                return False
+    if lift.current_state == "up":
+        if lift.check_if_at_top():
+            return False
+        else:
+            return lift.people_in_lift.next_floor_above(lift.current_floor) is not None
 
+    elif lift.current_state == "down":
+        if lift.check_if_at_bottom():
+            return False
+        else:
+            return lift.people_in_lift.next_floor_below(lift.current_floor) is not None
 
-def increment_all_waiting(people_list: list):
-    """
-    Increments the time spent waiting for all people currently waiting.
 
-    :param List people_list: All people in the building.
+def find_next_stop(waiting_queues: WaitingQueues, lift: Lift) -> int:
     """
-    for people in people_list:
-        if people.current_state == "waiting":
-            people.increase_wait_time()
+    Finds the nearest floor ahead of the lift where anyone is waiting or
+    anyone in the lift needs to get out.
 
+    :param WaitingQueues waiting_queues: Everyone waiting, by floor and direction.
+    :param Lift lift: The Lift object that is being used.
 
-def increment_all_in_lift(people_list: list):
+    :return: The next floor the lift needs to stop at, or the next floor along if there is none.
+    :rtype: int
     """
-    Increments the time spent in lift for all people in the lift currently.
+    if lift.current_state == "up":
+        stops = [
+            waiting_queues.next_floor_above(lift.current_floor),
+            lift.people_in_lift.next_floor_above(lift.current_floor)
+        ]
+        stops = [floor for floor in stops if floor is not None]
 
-    :param List people_list: All people in the building.
-    """
-    for people in people_list:
-        if people.current_state == "in lift":
-            people.increase_time_in_lift()
+        return min(stops) if stops else lift.current_floor + 1
 
+    else:
+        stops = [
+            waiting_queues.next_floor_below(lift.current_floor),
+            lift.people_in_lift.next_floor_below(lift.current_floor)
+        ]
+        stops = [floor for floor in stops if floor is not None]
 
-def get_all_waiting(people_list: list) -> int:
-    """
-    Returns the total steps spent waiting.
+        return max(stops) if stops else lift.current_floor - 1
 
-    :param list people_list: All people in the building.
 
-    :return: The total steps spent by all Person objects waiting.
-    :rtype: int
+def move_lift_ahead(lift: Lift, waiting_queues: WaitingQueues, event_driven: bool) -> int:
     """
-    total_wait = 0
-    for people in people_list:
-        people: Person
-        if people.current_state == "arrived":
-            total_wait += people.get_wait_time()
+    Moves the lift on in its current direction.
 
-    return total_wait
-
-
-def get_all_in_lift(people_list: list) -> int:
-    """
-    Returns the total number of steps spent in the lift.
+    Stepping moves the lift a single floor. Event driven, the lift jumps
+    straight to the next floor where anyone can get in or out; nothing can
+    happen on the floors in between, so this takes exactly as many steps
+    as stepping there one floor at a time.
 
-    :param list people_list: All people in the building.
+    :param Lift lift: The Lift object that is being used.
+    :param WaitingQueues waiting_queues: Everyone waiting, by floor and direction.
+    :param bool event_driven: Whether to jump to the next stop instead of a single floor.
 
-    :return: The total steps spent by all Person objects in the lift
+    :return: The number of steps taken.
     :rtype: int
     """
-    total_in_lift = 0
-    for people in people_list:
-        people: Person
-        if people.current_state == "arrived":
-            total_in_lift += people.get_time_in_lift()
+    if event_driven:
+        number_of_floors = abs(find_next_stop(waiting_queues, lift) - lift.current_floor)
+    else:
+        number_of_floors = 1
 
-    return total_in_lift
+    lift.move_by_floors(number_of_floors)
+
+    return number_of_floors
 
 
 def better_lift_algorithm(number_of_floors: int, number_of_people: int,
-                          list_of_people: list = None):
+                          population: Union[Population, Scenario] = None, animate: bool = True,
+                          event_driven: bool = False, context: RunContext = None, seed=None,
+                          animation_speed: float = 1.0):
     """
     The main decision algorithm for improved lift.
 
     :param int number_of_floors: The total number of floors in the building.
     :param int number_of_people: The total number of people in the building.
-    :param list list_of_people: The list of all people in the building, defaults to None if no array is present.
+    :param Union[Population, Scenario] population: Everyone in the building, defaults to None if no population is
+    present. A scenario is turned into a fresh population for this run.
+    :param bool animate: Whether to animate the lift, defaults to True.
+    :param bool event_driven: Whether to skip straight past floors where nobody gets in or out, defaults to
+    False. The statistics are the same as stepping one floor at a time; the lift is never animated.
+    :param RunContext context: The counters for this run, defaults to None for a new set.
+    :param seed: The seed to generate a population from when none is given, defaults to None for fresh entropy.
+    :param float animation_speed: How many times normal speed to animate at, defaults to 1. None runs as fast as
+    possible, drawing frames as it goes.
     """
-    # Initialize animation if number of floors is less than 20.
-    if number_of_floors <= 20:
-        canvas_x, canvas_y, lift_width, lift_height, canvas, clock, lift_x_coord, lift_y_coord, lift_colour = \
-            initialize_animation(number_of_floors)
+    # Initialize animation.
+    # The animation module is only imported here so that headless runs never load pygame.
+    animation = None
+    if animate and not event_driven:
+        from animation import create_animation
+        animation = create_animation(number_of_floors, animation_speed)
 
     # Initialize the lift.
     lift = Lift(number_of_floors)
 
-    # If an array is not present, create one.
-    if list_of_people is None:
-        list_of_people = generate_people(number_of_floors, number_of_people)
-    else:
-        list_of_people = list_of_people
+    # If a population is not present, create one.
+    if population is None:
+        population = generate_people(number_of_floors, number_of_people, seed)
+    elif isinstance(population, Scenario):
+        population = population.create_population()
 
-    # Create the occurrence array.
-    occurrence_list = create_people_occurrence_list(list_of_people)
+    # Create the occurrence array and queue everyone by floor and direction.
+    occurrence_list = create_people_occurrence_list(population, number_of_floors)
+    waiting_queues = WaitingQueues(number_of_floors, population, occurrence_list)
 
-    is_done = False
-    max_people = len(list_of_people)
-    people_arrived = []
+    if context is None:
+        context = RunContext()
+    max_people = len(population)
+    if context.trace is not None:
+        context.trace.start(number_of_floors, occurrence_list)
 
-    # Loop terminates when no people are left or when is_done is True.
-    while list_of_people and not is_done:
+    # Loop terminates when everyone has been delivered or when the run is done.
+    while (waiting_queues or lift.people_in_lift) and not context.is_done:
         # Below condition allows for window to terminate if QUIT event is sent.
-        if number_of_floors <= 20:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    is_done = True
-
-        # For every person in building, iterate.
-        for people in list_of_people:
-            people: Person
-            people.increase_wait_time()
-
-            # If they are waiting, on same floor as lift,
-            # going in the same direction and there is space,
-            # add them to the lift.
-            if people.current_state == "waiting":
-                if people.start_floor == lift.current_floor:
-                    if people.direction_to_move == lift.current_state:
-                        if lift.get_current_capacity() != 0:
-                            lift.add_person_to_lift(people)
-                            people.get_in_lift()
-                            list_of_people.remove(people)
-                            occurrence_list = update_occurrence_list(occurrence_list, lift.current_floor)
-
-        # For every person in the lift, iterate.
-        for people in lift.people_in_lift:
-            people: Person
-            people.increase_time_in_lift()
-
-            # If lift is on a person's target floor, they get off the lift.
-            if people.target_floor == lift.current_floor:
-                people.get_out_of_lift()
-                lift.remove_person_from_lift(people)
-                people_arrived.append(people)
-
-        # If there are still people in the same direction as the lift.
-        if check_ahead(occurrence_list, lift):
-
-            # If lift is going up, move up, animate movement and reset lift switch counter.
-            if lift.current_state == "up":
-                lift.move_lift_up()
-                lift.increment_lifetime_steps()
-                if number_of_floors <= 20:
-                    lift_y_coord -= (lift_height + 3)
-                    lift.time_switched = 0
-
-            # If lift is going down, move down, animate movement and reset lift switch counter.
-            elif lift.current_state == "down":
-                lift.move_lift_down()
-                lift.increment_lifetime_steps()
-                if number_of_floors <= 20:
-                    lift_y_coord += (lift_height + 3)
-                    lift.time_switched = 0
+        if animation is not None and animation.is_closed():
+            context.finish()
+
+        context.advance()
+
+        # Everyone waiting on the same floor as the lift, going in the
+        # same direction, gets in while there is space.
+        number_boarded = 0
+        while lift.get_current_capacity() != 0 and \
+                waiting_queues.count(lift.current_floor, lift.current_state):
+            people = waiting_queues.pop_person(lift.current_floor, lift.current_state)
+            lift.add_person_to_lift(people, int(population.target_floor[people]))
+            population.get_in_lift(people, context.step)
+            if context.events.records_events:
+                context.events.boarded(context.step, people, lift.current_floor)
+            occurrence_list = update_occurrence_list(occurrence_list, lift.current_floor)
+            number_boarded += 1
+
+        # Everyone in the lift whose target is this floor gets off.
+        people_arrived = lift.remove_people_on_floor(lift.current_floor)
+        for people in people_arrived:
+            population.get_out_of_lift(people, context.step)
+            context.record_wait(int(population.board_step[people] - population.arrival_step[people]))
+            context.record_time_in_lift(int(population.alight_step[people] - population.board_step[people]))
+            if context.events.records_events:
+                context.events.alighted(context.step, people, lift.current_floor, int(population.start_floor[people]))
+
+        if context.trace is not None:
+            context.trace.record(context.step, lift.current_floor, UP if lift.current_state == "up" else DOWN,
+                                 number_boarded, len(people_arrived))
+
+        # If there are still people in the same direction as the lift,
+        # move on and reset lift switch counter.
+        if check_ahead(waiting_queues, lift):
+            context.advance(move_lift_ahead(lift, waiting_queues, event_driven) - 1)
+            lift.time_switched = 0
 
         # If there are no people in same direction.
         else:
 
             # Check if people in lift need to go in current direction.
             if check_passengers(lift):
-
-                # If lift is going up, move up, animate movement and reset lift switch counter.
-                if lift.current_state == "up":
-                    lift.move_lift_up()
-                    lift.increment_lifetime_steps()
-                    if number_of_floors <= 20:
-                        lift_y_coord -= (lift_height + 3)
-                        lift.time_switched = 0
-
-                # If lift is going down, move down, animate movement and reset lift switch counter.
-                elif lift.current_state == "down":
-                    lift.move_lift_down()
-                    lift.increment_lifetime_steps()
-                    if number_of_floors <= 20:
-                        lift_y_coord += (lift_height + 3)
-                        lift.time_switched = 0
+                context.advance(move_lift_ahead(lift, waiting_queues, event_driven) - 1)
+                lift.time_switched = 0
 
             # Finally, if there is no in or out of lift to go in that direction,
             # turn the other direction and repeat.
@@ -630,55 +414,34 @@ def better_lift_algorithm(number_of_floors: int, number_of_people: int,
                 lift.switch_direction()
                 lift.time_switched += 1
 
-        # If the number of floors is 20 or less, animate the lift.
-        #
-        # This is done to prevent the animation from leaving the
-        # physical bounds of the screen.
-        if number_of_floors <= 20:
-            animate.draw_white_bg(canvas)
-            animate.draw_building_lines(canvas, number_of_floors, lift_width, lift_height, lift_x_coord)
-            draw_people_on_floor(canvas, number_of_floors, lift_height, lift_x_coord, occurrence_list)
-            pygame.draw.rect(canvas, lift_colour, pygame.Rect(lift_x_coord, lift_y_coord, lift_width, lift_height))
-            pygame.display.flip()
-            clock.tick(number_of_floors)
-
-            # If the number of direction switches is more than 5,
-            # terminate the animation.
-            #
-            # The lift should never switch more than a few times,
-            # unless there is no one left in the building to serve.
-            if lift.time_switched > 5:
-                is_done = True
+        # Animate the lift. Above 20 floors, the animation scrolls
+        # to keep the lift within the physical bounds of the screen.
+        if animation is not None:
+            animation.draw(lift.current_floor, occurrence_list)
 
+        # If the number of direction switches is more than 5,
+        # terminate the simulation.
+        #
+        # The lift should never switch more than a few times,
+        # unless there is no one left in the building to serve.
         if lift.time_switched > 5:
-            is_done = True
-
-    # Calculate the stats for simulation and print.
-    total_wait = get_all_waiting(people_arrived)
-    if total_wait == 0:
-        total_wait = 1
+            context.finish()
 
+    # Calculate the stats for simulation and report them.
+    total_wait = context.total_wait
     avg_wait = total_wait // max_people
-    if avg_wait == 0:
-        avg_wait = 1
-
     life_steps = lift.lifetime_steps
+    total_in_lift = context.total_in_lift
+    avg_in_lift = total_in_lift // max_people
 
-    total_in_lift = get_all_in_lift(people_arrived)
-    if total_in_lift == 0:
-        total_in_lift = 1
+    statistics = number_of_floors, life_steps, total_wait, total_in_lift, max_people, avg_wait, avg_in_lift
+    if context.events.records_summary:
+        context.events.summary(None, statistics, context.distributions())
 
-    avg_in_lift = total_in_lift // max_people
-    if avg_in_lift == 0:
-        avg_in_lift = 1
-
-    print("Number of Floors:", number_of_floors, "floors.")
-    print("Lifetime steps for lift:", life_steps, "steps.")
-    print("Total Time Waiting for Lift:", total_wait, "steps.")
-    print("Total Time in Lift:", total_in_lift, "steps.")
-    print("Number of People:", max_people, "people.")
-    print("Average Wait Time:", avg_wait, "steps per person.")
-    print("Average Time in Lift:", avg_in_lift, "steps per person.")
-    pygame.quit()
-
-    return number_of_floors, life_steps, total_wait, total_in_lift, max_people, avg_wait, avg_in_lift
+    if context.trace is not None:
+        context.trace.close()
+
+    if animation is not None:
+        animation.close()
+
+    return statistics
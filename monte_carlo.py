@@ -0,0 +1,320 @@
+"""
+This module runs many independent replications of a lift simulation at
+once. Each replication is one building, stored as one row of a set of
+NumPy arrays, and every row is stepped together.
+
+Both policies make the same decisions as naive_lift_algorithm and
+better_lift_algorithm run event driven, so each row gives the same
+statistics as running its population through those subroutines.
+"""
+import numpy as np
+from population import UP, DOWN, generate_scenario
+
+LIFT_CAPACITY = 6
+NO_FLOOR_ABOVE = np.iinfo(np.int64).max
+NO_FLOOR_BELOW = 0
+
+
+class Replications:
+    """
+    The state of a batch of replications, one row per building.
+
+    People are only looked at once, when they get in, so a step costs the
+    same however many people there are. Waiting people are held in a queue
+    for each floor, lowest row first, split by direction if the lift only
+    takes people going its way. Each replication keeps a count of the
+    people waiting on each floor, and of the people in the lift getting
+    off at each floor with the total of the steps they got in at, which is
+    all the next stop and the wait and time in lift totals need.
+
+    :param int number_of_floors: The total number of floors in every building.
+    :param np.ndarray start_floor: The start floor of each person, one row per replication.
+    :param np.ndarray target_floor: The target floor of each person, one row per replication.
+    :param bool by_direction: Whether people going up and down queue separately, defaults to False.
+    """
+
+    def __init__(self, number_of_floors: int, start_floor: np.ndarray, target_floor: np.ndarray,
+                 by_direction: bool = False):
+        """ Replications Constructor. """
+        self.number_of_floors = number_of_floors
+        self.by_direction = by_direction
+        start_floor = np.asarray(start_floor, dtype=np.int64)
+        target_floor = np.asarray(target_floor, dtype=np.int64)
+
+        number_of_replications, number_of_people = start_floor.shape
+        self.number_of_people = number_of_people
+        self.queues_per_replication = (number_of_floors + 1) * (2 if by_direction else 1)
+
+        # Each queue is a run of the target floors sorted by queue, with a head that moves along as people get in.
+        direction = np.where(target_floor > start_floor, UP, DOWN)
+        queue = self.get_queue(np.arange(number_of_replications)[:, None], start_floor, direction).ravel()
+        queue_length = np.bincount(queue, minlength=number_of_replications * self.queues_per_replication)
+        self.queued_target = target_floor.ravel()[np.argsort(queue, kind="stable")]
+        self.queue_end = np.cumsum(queue_length)
+        self.queue_head = self.queue_end - queue_length
+
+        self.waiting_count = np.zeros((number_of_replications, number_of_floors + 1), dtype=np.int64)
+        np.add.at(self.waiting_count, (np.arange(number_of_replications)[:, None], start_floor), 1)
+        self.destination_count = np.zeros((number_of_replications, number_of_floors + 1), dtype=np.int64)
+        self.destination_board_steps = np.zeros((number_of_replications, number_of_floors + 1), dtype=np.int64)
+        self.total_wait = np.zeros(number_of_replications, dtype=np.int64)
+        self.total_in_lift = np.zeros(number_of_replications, dtype=np.int64)
+        self.remaining = np.full(number_of_replications, number_of_people, dtype=np.int64)
+
+        self.current_floor = np.ones(number_of_replications, dtype=np.int64)
+        self.current_direction = np.full(number_of_replications, UP, dtype=np.int8)
+        self.capacity = np.full(number_of_replications, LIFT_CAPACITY, dtype=np.int64)
+        self.lifetime_steps = np.zeros(number_of_replications, dtype=np.int64)
+        self.step = np.zeros(number_of_replications, dtype=np.int64)
+        self.time_switched = np.zeros(number_of_replications, dtype=np.int64)
+        self.active = self.remaining > 0
+
+    def get_queue(self, replication: np.ndarray, floor: np.ndarray, direction: np.ndarray) -> np.ndarray:
+        """
+        Returns the index of the queue for a floor and direction in a replication.
+
+        :param np.ndarray replication: The replication.
+        :param np.ndarray floor: The floor.
+        :param np.ndarray direction: The direction, ignored unless people queue by direction.
+
+        :return: The queue index.
+        :rtype: np.ndarray
+        """
+        if self.by_direction:
+            floor = floor * 2 + direction
+
+        return replication * self.queues_per_replication + floor
+
+    def board(self, replication: np.ndarray, direction: np.ndarray = None):
+        """
+        Boards people waiting on the lift's floor, lowest row first, while each lift has space.
+
+        :param np.ndarray replication: The replications whose lift takes people in.
+        :param np.ndarray direction: The direction people must be going, defaults to None for any.
+        """
+        queue = self.get_queue(replication, self.current_floor[replication], direction)
+        boarding = np.minimum(self.queue_end[queue] - self.queue_head[queue], self.capacity[replication])
+
+        # The positions of everyone boarding, a run from the head of each queue.
+        first = np.repeat(self.queue_head[queue] - np.cumsum(boarding) + boarding, boarding)
+        position = first + np.arange(len(first))
+        boarded_in = np.repeat(replication, boarding)
+        destination = (boarded_in, self.queued_target[position])
+        np.add.at(self.destination_count, destination, 1)
+        np.add.at(self.destination_board_steps, destination, self.step[boarded_in])
+
+        self.queue_head[queue] += boarding
+        self.waiting_count[replication, self.current_floor[replication]] -= boarding
+        self.capacity[replication] -= boarding
+
+    def alight(self, replication: np.ndarray):
+        """
+        Everyone whose target is the lift's floor gets off.
+
+        :param np.ndarray replication: The replications whose lift lets people out.
+        """
+        floor = self.current_floor[replication]
+        alighting = self.destination_count[replication, floor]
+        board_steps = self.destination_board_steps[replication, floor]
+
+        self.total_wait[replication] += board_steps
+        self.total_in_lift[replication] += alighting * self.step[replication] - board_steps
+        self.capacity[replication] += alighting
+        self.remaining[replication] -= alighting
+        self.destination_count[replication, floor] = 0
+        self.destination_board_steps[replication, floor] = 0
+
+    def get_wait_totals(self) -> np.ndarray:
+        """
+        Returns the total steps spent waiting by everyone that has arrived, per replication.
+
+        :return: The total wait of each replication.
+        :rtype: np.ndarray
+        """
+        return self.total_wait
+
+    def get_in_lift_totals(self) -> np.ndarray:
+        """
+        Returns the total steps spent in the lift by everyone that has arrived, per replication.
+
+        :return: The total time in lift of each replication.
+        :rtype: np.ndarray
+        """
+        return self.total_in_lift
+
+
+def step_naive(replications: Replications):
+    """
+    Runs one iteration of the naive lift in every active replication: jump
+    along the sweep to the next floor where anyone can get in or out, let
+    people out, then let people in.
+
+    :param Replications replications: The batch to step.
+    """
+    active = np.flatnonzero(replications.active)
+    sweep_length = 2 * (replications.number_of_floors - 1)
+    current_floor = replications.current_floor[active]
+    position = np.where(
+        replications.current_direction[active] == UP,
+        current_floor - 1,
+        (sweep_length - (current_floor - 1)) % sweep_length
+    )
+
+    # Steps until the lift next reaches each floor, on its way up or down.
+    floor = np.arange(replications.number_of_floors + 1)
+    steps_up_leg = ((floor - 1) - position[:, None] - 1) % sweep_length + 1
+    steps_down_leg = ((sweep_length - (floor - 1)) - position[:, None] - 1) % sweep_length + 1
+    is_stop = (replications.destination_count[active] > 0) | \
+        ((replications.waiting_count[active] > 0) & (replications.capacity[active] > 0)[:, None])
+    is_stop[:, 0] = False
+
+    number_of_steps = np.where(is_stop, np.minimum(steps_up_leg, steps_down_leg), NO_FLOOR_ABOVE).min(axis=1)
+    number_of_steps[number_of_steps == NO_FLOOR_ABOVE] = 1
+
+    position = (position + number_of_steps) % sweep_length
+    going_up = (position > 0) & (position <= sweep_length // 2)
+    replications.current_floor[active] = np.where(
+        going_up, 1 + position, 1 + (sweep_length - position) % sweep_length
+    )
+    replications.current_direction[active] = np.where(going_up, UP, DOWN)
+    replications.lifetime_steps[active] += number_of_steps
+    replications.step[active] += number_of_steps
+
+    replications.alight(active)
+    replications.board(active)
+
+    replications.active = replications.remaining > 0
+
+
+def step_improved(replications: Replications):
+    """
+    Runs one iteration of the improved lift in every active replication:
+    let people going the lift's way in, let people out, then either jump
+    to the next stop ahead or turn around.
+
+    :param Replications replications: The batch to step.
+    """
+    active = np.flatnonzero(replications.active)
+    replications.step[active] += 1
+
+    replications.board(active, replications.current_direction[active])
+    replications.alight(active)
+
+    # The nearest floor ahead, in each direction, where anyone is waiting or getting off. Nobody
+    # is ever on floor 0, so it is marked as a stop and found when there is no stop ahead.
+    current_floor = replications.current_floor[active]
+    floor = np.arange(replications.number_of_floors + 1)
+    is_stop = (replications.destination_count[active] > 0) | (replications.waiting_count[active] > 0)
+    is_stop[:, NO_FLOOR_BELOW] = True
+    next_above = (is_stop & (floor > current_floor[:, None])).argmax(axis=1)
+    stops_below = is_stop & (floor < current_floor[:, None])
+    next_below = replications.number_of_floors - stops_below[:, ::-1].argmax(axis=1)
+
+    going_up = replications.current_direction[active] == UP
+    next_stop = np.where(going_up, next_above, next_below)
+    moving = next_stop != NO_FLOOR_BELOW
+
+    number_of_floors = np.where(moving, np.abs(next_stop - current_floor), 0)
+    replications.current_floor[active[moving]] = next_stop[moving]
+    replications.lifetime_steps[active] += number_of_floors
+    replications.step[active] += np.maximum(number_of_floors - 1, 0)
+    replications.time_switched[active[moving]] = 0
+    replications.time_switched[active[~moving]] += 1
+    replications.current_direction[active[~moving]] ^= 1
+
+    replications.active = (replications.remaining > 0) & (replications.time_switched <= 5)
+
+
+def naive_replications(number_of_floors: int, start_floor: np.ndarray, target_floor: np.ndarray) -> tuple:
+    """
+    Runs the naive lift over a batch of populations.
+
+    :param int number_of_floors: The total number of floors in every building.
+    :param np.ndarray start_floor: The start floor of each person, one row per replication.
+    :param np.ndarray target_floor: The target floor of each person, one row per replication.
+
+    :return: The same statistics as naive_lift_algorithm, with one entry per replication for each
+    that varies: floors, lifetime steps, total wait, total in lift, people, average wait, average in lift.
+    :rtype: tuple
+    """
+    replications = Replications(number_of_floors, start_floor, target_floor)
+    while replications.active.any():
+        step_naive(replications)
+
+    max_people = replications.number_of_people
+    life_steps = replications.lifetime_steps
+    total_wait = replications.get_wait_totals()
+    total_in_lift = replications.get_in_lift_totals()
+
+    return number_of_floors, life_steps, total_wait, total_in_lift, max_people, \
+        total_wait // max_people, total_in_lift // max_people
+
+
+def improved_replications(number_of_floors: int, start_floor: np.ndarray, target_floor: np.ndarray) -> tuple:
+    """
+    Runs the improved lift over a batch of populations.
+
+    :param int number_of_floors: The total number of floors in every building.
+    :param np.ndarray start_floor: The start floor of each person, one row per replication.
+    :param np.ndarray target_floor: The target floor of each person, one row per replication.
+
+    :return: The same statistics as better_lift_algorithm, with one entry per replication for each
+    that varies: floors, lifetime steps, total wait, total in lift, people, average wait, average in lift.
+    :rtype: tuple
+    """
+    replications = Replications(number_of_floors, start_floor, target_floor, by_direction=True)
+    while replications.active.any():
+        step_improved(replications)
+
+    max_people = replications.number_of_people
+    life_steps = replications.lifetime_steps
+    total_wait = replications.get_wait_totals()
+    total_in_lift = replications.get_in_lift_totals()
+
+    return number_of_floors, life_steps, total_wait, total_in_lift, max_people, \
+        total_wait // max_people, total_in_lift // max_people
+
+
+ALGORITHMS = {
+    "naive": naive_replications,
+    "improved": improved_replications
+}
+
+
+def run_replications(algorithm: str, number_of_floors: int, number_of_people: int,
+                     number_of_replications: int, rng=None) -> tuple:
+    """
+    Generates a random population for each replication and runs them all together.
+    The same seed always gives the same statistics.
+
+    :param str algorithm: Either naive or improved.
+    :param int number_of_floors: The total number of floors in every building.
+    :param int number_of_people: The number of people in each building.
+    :param int number_of_replications: The number of buildings to simulate.
+    :param rng: A seed, SeedSequence or Generator to draw from, defaults to None for fresh entropy.
+
+    :return: The statistics of the chosen algorithm, one entry per replication.
+    :rtype: tuple
+    """
+    scenario = generate_scenario(number_of_floors, number_of_people * number_of_replications, rng)
+    start_floor = scenario.start_floor.reshape(number_of_replications, number_of_people)
+    target_floor = scenario.target_floor.reshape(number_of_replications, number_of_people)
+
+    return ALGORITHMS[algorithm](number_of_floors, start_floor, target_floor)
+
+
+def mean_confidence_interval(values: np.ndarray, z_score: float = 1.96) -> tuple:
+    """
+    Returns the mean of a statistic over replications and the half width of its confidence interval.
+
+    :param np.ndarray values: One value per replication.
+    :param float z_score: The normal z score of the interval, defaults to 1.96 for 95%.
+
+    :return: The mean and the half width of the interval.
+    :rtype: tuple
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return float(values.mean()), 0.0
+
+    return float(values.mean()), float(z_score * values.std(ddof=1) / np.sqrt(len(values)))
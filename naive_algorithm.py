@@ -1,92 +1,8 @@
-import random
-from copy import deepcopy
-import pygame
-import animation as animate
+import numpy as np
 from typing import Union
-
-total_time_naive = 0
-total_time_better = 0
-
-
-class Person:
-    """
-    Represents a passenger in the lift.
-
-    :param int current_floor: The current floor that the person is on.
-    :param str direction_to_move: The direction in which the person will move.
-    :param int target_floor: The floor on which the person will exit the lift.
-    """
-
-    def __init__(self, current_floor: int, direction_to_move: str, target_floor: int):
-        """ Person constructor. """
-        self.start_floor = current_floor
-        self.direction_to_move = direction_to_move
-        self.target_floor = target_floor
-
-        self.wait_time = 0
-        self.time_in_lift = 0
-        self.current_state = "waiting"
-        self.all_states = ["waiting", "in lift", "arrived"]
-
-    def get_target_floor(self) -> int:
-        """
-        Returns the target floor of a person.
-
-        :return: The floor on which the person will get off the lift.
-        :rtype: int
-        """
-
-        return self.target_floor
-
-    def get_wait_time(self) -> int:
-        """
-        Returns the wait time of person.
-
-        :return: The time spent waiting for the lift.
-        :rtype: int
-        """
-
-        return self.wait_time
-
-    def get_time_in_lift(self) -> int:
-        """
-        Returns the time_in_lift of person.
-
-        :return: The time spent in the lift.
-        :rtype: int
-        """
-
-        return self.time_in_lift
-
-    def increase_wait_time(self):
-        """ Increments the wait time by one. """
-        self.wait_time += 1
-
-    def increase_time_in_lift(self):
-        """ Increments time in lift by one. """
-        self.time_in_lift += 1
-
-    def change_state(self, new_state: str):
-        """
-        Change the current_state to a given state.
-
-        :param str new_state: The new state that is to be changed to.
-        """
-
-        if new_state in self.all_states:
-            self.current_state = new_state
-
-    def get_in_lift(self):
-        """ Changes the current state to in lift. """
-
-        self.change_state("in lift")
-        print("Got in lift at", self.start_floor)
-
-    def get_out_of_lift(self):
-        """ Changes the current state to arrived. """
-
-        self.change_state("arrived")
-        print("Arrived at floor", self.target_floor, "from floor", self.start_floor)
+from floor_index import DestinationCounts, WaitingQueues
+from population import Population, Scenario, UP, DOWN, generate_population
+from run_context import RunContext
 
 
 class NaiveLift:
@@ -94,42 +10,45 @@ class NaiveLift:
     Defines the lift used in the Naive Lift Algorithm.
 
     :param int number_of_floors: The total number of floors in the building.
-    :param list all_people: All people in the building.
+    :param Population all_people: All people in the building.
     :param int current_floor: The current floor the lift is on.
     :param str current_direction: The current direction the lift is moving in.
     """
 
-    def __init__(self, number_of_floors: int, all_people: list, current_floor: int = 1, current_direction: str = "up"):
+    def __init__(self, number_of_floors: int, all_people: Population, current_floor: int = 1, current_direction: str = "up"):
         self.current_floor: int = current_floor
         self.current_direction: str = current_direction
         self.bottom_floor: int = 1
         self.top_floor: int = number_of_floors
         self.lifetime_steps: int = 0
-        self.people_in_lift: list = []
-        self.all_people: list = all_people
+        self.people_in_lift: DestinationCounts = DestinationCounts(number_of_floors)
+        self.all_people: Population = all_people
         self.capacity = 6
 
-    def add_people_to_lift(self, person):
+    def add_people_to_lift(self, person: int):
         """
         Adds a given person to the lift.
 
-        :param Person person: The person that is to be added to the lift.
+        :param int person: The row of the person that is to be added to the lift.
         """
 
-        self.people_in_lift.append(person)
+        self.people_in_lift.add_person(person, int(self.all_people.target_floor[person]))
         self.decrease_capacity()
 
-    def remove_people_from_lift(self, person):
+    def remove_people_on_floor(self, floor: int) -> list:
         """
-        Removes a given person from the lift.
+        Removes everyone getting off on a given floor from the lift.
 
-        :param Person person: The person that is to be removed from the lift.
+        :param int floor: The floor the lift is on.
+        :return: The rows of the people that got off.
+        :rtype: list
         """
 
-        for index in self.people_in_lift:
-            if index == person:
-                self.people_in_lift.remove(index)
-                self.increase_capacity()
+        people = self.people_in_lift.remove_people_on_floor(floor)
+        for _ in people:
+            self.increase_capacity()
+
+        return people
 
     def change_directions(self):
         """ Changes the direction of travel of the lift. """
@@ -149,16 +68,10 @@ class NaiveLift:
                 self.current_floor -= 1
                 self.increment_lifetime_steps()
 
-                if self.top_floor <= 20:
-                    print("Currently on floor", self.current_floor, "moving", self.current_direction)
-
             else:
                 self.current_floor += 1
                 self.increment_lifetime_steps()
 
-                if self.top_floor <= 20:
-                    print("Currently on floor", self.current_floor, "moving", self.current_direction)
-
         elif self.current_direction == "down":
 
             if self.current_floor == self.bottom_floor:
@@ -166,15 +79,54 @@ class NaiveLift:
                 self.current_floor += 1
                 self.increment_lifetime_steps()
 
-                if self.top_floor <= 20:
-                    print("Currently on floor", self.current_floor, "moving", self.current_direction)
-
             else:
                 self.current_floor -= 1
                 self.increment_lifetime_steps()
 
-                if self.top_floor <= 20:
-                    print("Currently on floor", self.current_floor, "moving", self.current_direction)
+    def get_sweep_position(self) -> int:
+        """
+        Returns how far the lift is through its sweep from the bottom floor to the top and back down.
+
+        :return: The number of floors travelled since the lift last left the bottom floor.
+        :rtype: int
+        """
+        sweep_length = 2 * (self.top_floor - self.bottom_floor)
+        if self.current_direction == "up":
+            return self.current_floor - self.bottom_floor
+        else:
+            return (sweep_length - (self.current_floor - self.bottom_floor)) % sweep_length
+
+    def steps_to_floor(self, floor: int) -> int:
+        """
+        Returns how many steps the lift will take to next reach a given floor.
+
+        :param int floor: The floor to reach.
+        :return: The number of steps, always at least one.
+        :rtype: int
+        """
+        sweep_length = 2 * (self.top_floor - self.bottom_floor)
+        position = self.get_sweep_position()
+        floor_positions = (floor - self.bottom_floor, sweep_length - (floor - self.bottom_floor))
+
+        return min(((floor_position - position - 1) % sweep_length) + 1 for floor_position in floor_positions)
+
+    def move_lift_by_floors(self, number_of_steps: int):
+        """
+        Moves the lift a number of floors along its sweep, changing direction at the top and bottom floors.
+
+        :param int number_of_steps: The number of floors to move.
+        """
+        sweep_length = 2 * (self.top_floor - self.bottom_floor)
+        position = (self.get_sweep_position() + number_of_steps) % sweep_length
+
+        if 0 < position <= sweep_length // 2:
+            self.current_direction = "up"
+            self.current_floor = self.bottom_floor + position
+        else:
+            self.current_direction = "down"
+            self.current_floor = self.bottom_floor + ((sweep_length - position) % sweep_length)
+
+        self.lifetime_steps += number_of_steps
 
     def increment_lifetime_steps(self):
         """ Increases the lifetime number of steps by one. """
@@ -191,238 +143,130 @@ class NaiveLift:
             self.capacity -= 1
 
 
-def increase_all_waiting(list_of_people: list):
-    """ Increases the amount of time person has been waiting. """
-    for person in list_of_people:
-        if person.current_state == "waiting":
-            person.increase_wait_time()
-
-
-def increase_all_in_elevator(list_of_people: list):
-    """ Increases the amount of time a person has spent in elevator. """
-    for person in list_of_people:
-        person: Person
-        if person.current_state == "in lift":
-            person.increase_time_in_lift()
-
-
-def remove_from_people_list(list_of_people: list):
-    """ Removes a person from the list of people. """
-    for person in list_of_people:
-        if person.current_state == "arrived":
-            list_of_people.remove(person)
-
-
-def check_for_people(list_of_people: list, lift: NaiveLift):
+def check_for_people(waiting_queues: WaitingQueues, lift: NaiveLift) -> bool:
     """ Checks if there are people on the same floor as the lift that are waiting. """
-    for person in list_of_people:
-        if person.current_state == "waiting":
-            if lift.current_floor == person.start_floor:
-                return True
-        else:
-            return False
+    return waiting_queues.count(lift.current_floor) > 0
 
 
-def return_people_on_floor(list_of_people: list, lift: NaiveLift):
-    """ Returns the person that is on the same floor as the lift waiting. """
+def return_people_on_floor(waiting_queues: WaitingQueues, lift: NaiveLift) -> list:
+    """ Takes the people waiting on the same floor as the lift off their queues, up to the lift's capacity. """
     people_on_floor = []
 
-    for person in list_of_people:
-        if person.current_state == "waiting":
-            if lift.current_floor == person.start_floor:
-                people_on_floor.append(person)
+    while len(people_on_floor) < lift.capacity and check_for_people(waiting_queues, lift):
+        people_on_floor.append(waiting_queues.pop_person(lift.current_floor))
 
     return people_on_floor
 
 
-def add_person_to_lift(person: Person, lift: NaiveLift):
+def add_person_to_lift(person: int, lift: NaiveLift, context: RunContext):
     """ Adds a person to the lift. """
     lift.add_people_to_lift(person)
-    person.get_in_lift()
+    lift.all_people.get_in_lift(person, context.step)
+    if context.events.records_events:
+        context.events.boarded(context.step, person, lift.current_floor)
 
 
-def remove_person_from_lift(person: Person, lift: NaiveLift, list_of_people: list):
-    """ Removes a person form the lift. """
-    person.get_out_of_lift()
-    lift.remove_people_from_lift(person)
-    remove_from_people_list(list_of_people)
+def remove_people_from_lift(lift: NaiveLift, context: RunContext) -> list:
+    """ Removes everyone getting off on the lift's current floor, returning their rows. """
+    people_on_floor = lift.remove_people_on_floor(lift.current_floor)
+    for person in people_on_floor:
+        lift.all_people.get_out_of_lift(person, context.step)
+        if context.events.records_events:
+            context.events.alighted(context.step, person, lift.current_floor,
+                                    int(lift.all_people.start_floor[person]))
 
-
-def check_if_on_target_floor(lift: NaiveLift, list_of_people: list):
-    """ Checks if any of the people in the lift are at their target floor. """
-    if isinstance(lift, NaiveLift):
-        global total_time_naive
-        for person in lift.people_in_lift:
-            if person.target_floor == lift.current_floor:
-                remove_person_from_lift(person, lift, list_of_people)
-                total_time_naive += person.time_in_lift
+    return people_on_floor
 
 
-def instance_rand_people(no_floors: int, is_random: bool = True, no_people: int = 30) -> list:
-    """
-    Creates new instances of people on random floors. Default is 30 people.
+def check_if_on_target_floor(lift: NaiveLift, context: RunContext) -> int:
+    """ Checks if any of the people in the lift are at their target floor, returning how many got off. """
+    number_arrived = 0
+    if isinstance(lift, NaiveLift):
+        people = lift.all_people
+        for person in remove_people_from_lift(lift, context):
+            context.record_wait(int(people.board_step[person] - people.arrival_step[person]))
+            context.record_time_in_lift(int(people.alight_step[person] - people.board_step[person]))
+            number_arrived += 1
 
-    :param int no_floors: The number of floors in the building.
-    :param bool is_random: Whether the number of people is random. Default is True.
-    :param int no_people: The number of people to generate. Default is 30.
-    :return: An array of all people in the building.
-    :rtype: list
-    """
+    return number_arrived
 
-    people = []
-    if is_random:
-        for person in range(random.randint(10, 30)):
-            rand_current_floor = random.randint(1, no_floors)
-            if rand_current_floor == no_floors:
-                rand_direction = "down"
-            elif rand_current_floor == 1:
-                rand_direction = "up"
-            else:
-                rand_direction = random.choice(["up", "down"])
 
-            if rand_direction == "up":
-                rand_target_floor = random.randint(rand_current_floor + 1, no_floors)
-            else:
-                rand_target_floor = random.randint(1, rand_current_floor - 1)
-
-            people.append(Person(rand_current_floor, rand_direction, rand_target_floor))
-    else:
-        for person in range(no_people):
-            rand_current_floor = random.randint(1, no_floors)
-            if rand_current_floor == no_floors:
-                rand_direction = "down"
-            elif rand_current_floor == 1:
-                rand_direction = "up"
-            else:
-                rand_direction = random.choice(["up", "down"])
+def steps_to_next_stop(lift: NaiveLift, waiting_queues: WaitingQueues) -> int:
+    """ Returns how many steps the lift will take to reach the next floor where anyone can get in or out. """
+    stops = [
+        lift.people_in_lift.next_floor_above(lift.current_floor),
+        lift.people_in_lift.next_floor_below(lift.current_floor),
+        lift.people_in_lift.highest_floor(),
+        lift.people_in_lift.lowest_floor()
+    ]
 
-            if rand_direction == "up":
-                rand_target_floor = random.randint(rand_current_floor + 1, no_floors)
-            else:
-                rand_target_floor = random.randint(1, rand_current_floor - 1)
+    if lift.capacity > 0:
+        stops.extend([
+            waiting_queues.next_floor_above(lift.current_floor),
+            waiting_queues.next_floor_below(lift.current_floor),
+            waiting_queues.highest_floor(),
+            waiting_queues.lowest_floor()
+        ])
 
-            people.append(Person(rand_current_floor, rand_direction, rand_target_floor))
+    steps = [lift.steps_to_floor(floor) for floor in stops if floor is not None]
+    if not steps:
+        return 1
 
-    return people
+    return min(steps)
 
 
-def initialize_animation(number_of_floors: int) -> Union[int, tuple, any]:
+def instance_rand_people(no_floors: int, is_random: bool = True, no_people: int = 30, seed=None) -> Population:
     """
-    Initializes the animation variables.
+    Creates new instances of people on random floors. Default is 30 people.
 
-    :param int number_of_floors: The number of floors in the building.
-    :return: Variables for use in animation.
-    :rtype: Union[int, tuple, any]
+    :param int no_floors: The number of floors in the building.
+    :param bool is_random: Whether the number of people is random. Default is True.
+    :param int no_people: The number of people to generate. Default is 30.
+    :param seed: A seed, SeedSequence or Generator to draw from. Default is None for fresh entropy.
+    :return: All people in the building.
+    :rtype: Population
     """
 
-    canvas_x, canvas_y = animate.calc_canvas_size(number_of_floors)
-    lift_width, lift_height = animate.calc_elevator_size(number_of_floors)
-    canvas = animate.canvas_init(canvas_x, canvas_y)
-    clock = pygame.time.Clock()
-    lift_x_coord = (canvas_x - lift_width) // 2
-    lift_y_coord = canvas_y - (lift_height + 10)
-    lift_colour = (60, 69, 82)
+    rng = np.random.default_rng(seed)
+    if is_random:
+        no_people = rng.integers(10, 31)
 
-    return canvas_x, canvas_y, lift_width, lift_height, canvas, clock, lift_x_coord, lift_y_coord, lift_colour
+    return generate_population(no_floors, no_people, rng)
 
 
-def create_people_occurrence_array(people_array: list) -> list:
+def create_people_occurrence_array(people_array: Population, no_floors: int) -> list:
     """
-    Creates an array containing dictionaries. Dictionaries contain floor number and how many people at that floor.
+    Creates an array containing the number of people on each floor, indexed by floor number. Index 0 is unused.
 
-    :param list people_array: Array of all people in the building.
+    :param Population people_array: All people in the building.
+    :param int no_floors: The number of floors in the building.
 
-    :return: Array of dictionaries mapping floor number to the number of people on said floor.
+    :return: The number of people on each floor.
     :rtype: list
     """
 
-    # Init empty arrays and dicts.
-    array_of_floors: list = []
-    floor_occurrence_array: list = []
-    floor_occurrence: dict = {}
-
-    # For every person in the array, add their start floor to the array.
-    for person in people_array:
-        array_of_floors.append(person.start_floor)
-
-    # For every floor in the array of floors, count how many times that floor occurs.
-    # Create a dictionary mapping floor number to number of occurrences.
-    # Finally, some floors are double counted. Iterate through, adding dicts
-    # Not in the final array to it, erasing double counts.
-    for floor in array_of_floors:
-        no_of_floor = array_of_floors.count(floor)
-        floor_occurrence["floor_number"] = floor
-        floor_occurrence["occurrences"] = no_of_floor
-
-        floor_occurrence_array.append(deepcopy(floor_occurrence))
-
-    final_list_occurrences = []
-    for occurrence in floor_occurrence_array:
-        if occurrence not in final_list_occurrences:
-            final_list_occurrences.append(occurrence)
-
-    return final_list_occurrences
+    return np.bincount(people_array.start_floor, minlength=no_floors + 1).tolist()
 
 
 def update_occurrence_array(occurrence_array: list, floor_number: int) -> list:
     """
     Updates a given floor in the occurrence array.
 
-    :param list occurrence_array: Array of dictionaries mapping floor number and people on floor.
+    :param list occurrence_array: Number of people on each floor, indexed by floor.
     :param int floor_number: The floor to be updated.
     :return: The updated occurrence array.
     :rtype: list
     """
 
-    for floor in occurrence_array:
-        if floor["floor_number"] == floor_number:
-            floor["occurrences"] = floor["occurrences"] - 1
-
-        if floor["occurrences"] == 0:
-            occurrence_array.remove(floor)
+    occurrence_array[floor_number] -= 1
 
     return occurrence_array
 
 
-def draw_people_on_floor(canvas, no_floors: int, lift_height: int, lift_x_coord: int, occurrence_array: list):
-    """
-    Draws the number of people on each floor onto the animation.
-
-    :param Canvas canvas: The canvas onto which the people are drawn.
-    :param int no_floors: The number of people in the building.
-    :param int lift_height: The pixel height of the lift.
-    :param int lift_x_coord: The X coordinate, in pixels, of the upper left corner of the lift.
-    :param list occurrence_array: Array of dictionaries mapping floor number and people on floor.
-    """
-
-    text_font = pygame.font.SysFont('comicsansms', 30)
-
-    for person in occurrence_array:
-        floor_number = int(person["floor_number"])
-        people_on_floor = str(person["occurrences"])
-
-        text_surface = text_font.render(people_on_floor, True, (0, 0, 0))
-        text_rectangle = text_surface.get_rect()
-        if lift_height == 60:
-            text_rectangle_x = lift_x_coord + 80
-        elif lift_height == 40:
-            text_rectangle_x = lift_x_coord + 60
-        else:
-            text_rectangle_x = lift_x_coord + 50
-
-        if floor_number == no_floors:
-            text_rectangle_y = 10 + (lift_height // 2)
-        elif floor_number == 1:
-            text_rectangle_y = (20 + (no_floors * lift_height) + ((no_floors - 1) * 3)) - (10 + (lift_height // 2))
-        else:
-            text_rectangle_y = ((12 + lift_height) + ((no_floors - floor_number) * (lift_height + 3))) - 2 - (
-                    lift_height // 2)
-
-        text_rectangle.center = (text_rectangle_x, text_rectangle_y)
-        canvas.blit(text_surface, text_rectangle)
-
-
-def naive_lift_algorithm(number_of_floors: int = 20, people_list: list = None, return_stats: bool = False):
+def naive_lift_algorithm(number_of_floors: int = 20, people_list: Union[Population, Scenario] = None,
+                         return_stats: bool = False,
+                         animate: bool = True, event_driven: bool = False, context: RunContext = None,
+                         seed=None, animation_speed: float = 1.0):
     """
     The main decision subroutine for this algorithm.
 
@@ -431,82 +275,92 @@ def naive_lift_algorithm(number_of_floors: int = 20, people_list: list = None, r
     stop at each floor and has a maximum capacity of 6 people.
 
     :param int number_of_floors: The number of floors in the building, defaults to 20.
-    :param list people_list: All people in the building, defaults to None. A previously formed array can be
-    used instead.
+    :param Union[Population, Scenario] people_list: All people in the building, defaults to None. A previously
+    formed population can be used instead, or a scenario, which is turned into a fresh population for this run.
     :param bool return_stats: Whether this subroutine should return various stats, defaults to False.
+    :param bool animate: Whether to animate the lift, defaults to True.
+    :param bool event_driven: Whether to skip straight past floors where nobody gets in or out, defaults to
+    False. The statistics are the same as stepping one floor at a time; the lift is never animated.
+    :param RunContext context: The counters for this run, defaults to None for a new set.
+    :param seed: The seed to generate a population from when none is given, defaults to None for fresh entropy.
+    :param float animation_speed: How many times normal speed to animate at, defaults to 1. None runs as fast as
+    possible, drawing frames as it goes.
     """
 
-    if number_of_floors <= 20:
-        lift_y_coord: int
-        canvas_x, canvas_y, lift_width, lift_height, canvas, clock, lift_x_coord, lift_y_coord, lift_colour = \
-            initialize_animation(number_of_floors)
-    is_done = False
+    # The animation module is only imported here so that headless runs never load pygame.
+    animation = None
+    if animate and not event_driven:
+        from animation import create_animation
+        animation = create_animation(number_of_floors, animation_speed)
+
+    if context is None:
+        context = RunContext()
 
     if not people_list:
-        people_list = instance_rand_people(number_of_floors)
+        people_list = instance_rand_people(number_of_floors, seed=seed)
+    elif isinstance(people_list, Scenario):
+        people_list = people_list.create_population()
 
-    occurrence_array = create_people_occurrence_array(people_list)
+    occurrence_array = create_people_occurrence_array(people_list, number_of_floors)
+    waiting_queues = WaitingQueues(number_of_floors, people_list, occurrence_array)
 
     naive_lift = NaiveLift(number_of_floors, people_list)
+    if context.trace is not None:
+        context.trace.start(number_of_floors, occurrence_array)
     max_people = len(people_list)
-    total_wait = 0
-    global total_time_naive
+    people_remaining = max_people
+
+    # Loop terminates when everyone has been delivered, or when the run is
+    # finished early by closing the window or cancelling it.
+    while people_remaining and not context.is_done:
+        if animation is not None and animation.is_closed():
+            context.finish()
+
+        # Event driven, the lift jumps straight to the next floor where anyone can get in or out.
+        if event_driven:
+            number_of_steps = steps_to_next_stop(naive_lift, waiting_queues)
+            naive_lift.move_lift_by_floors(number_of_steps)
+        else:
+            number_of_steps = 1
+            naive_lift.move_lift_by_one_floor()
+        context.advance(number_of_steps)
+        if context.events.records_events:
+            context.events.moved(context.step, naive_lift.current_floor, naive_lift.current_direction)
 
-    while people_list or not is_done:
-        if number_of_floors <= 20:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    is_done = True
+        number_arrived = check_if_on_target_floor(naive_lift, context)
+        people_remaining -= number_arrived
 
-        if people_list:
-            naive_lift.move_lift_by_one_floor()
+        people_on_floor = []
+        if check_for_people(waiting_queues, naive_lift):
+            people_on_floor = return_people_on_floor(waiting_queues, naive_lift)
+
+            for person in people_on_floor:
+                add_person_to_lift(person, naive_lift, context)
+                occurrence_array = update_occurrence_array(occurrence_array, naive_lift.current_floor)
 
-            if number_of_floors <= 20:
-                if naive_lift.current_direction == "up":
-                    lift_y_coord -= (lift_height + 3)
-                elif naive_lift.current_direction == "down":
-                    lift_y_coord += (lift_height + 3)
-
-            increase_all_waiting(people_list)
-            increase_all_in_elevator(people_list)
-            check_if_on_target_floor(naive_lift, people_list)
-
-            if check_for_people(people_list, naive_lift):
-                people_on_floor = return_people_on_floor(people_list, naive_lift)
-
-                for person in people_on_floor:
-                    if 0 < naive_lift.capacity <= 6:
-                        add_person_to_lift(person, naive_lift)
-                        total_wait += person.wait_time
-                        occurrence_array = update_occurrence_array(occurrence_array, naive_lift.current_floor)
-
-        if number_of_floors <= 20:
-            animate.draw_white_bg(canvas)
-            animate.draw_building_lines(canvas, number_of_floors, lift_width, lift_height, lift_x_coord)
-            draw_people_on_floor(canvas, number_of_floors, lift_height, lift_x_coord, occurrence_array)
-            pygame.draw.rect(canvas, lift_colour, pygame.Rect(lift_x_coord, lift_y_coord, lift_width, lift_height))
-            pygame.display.flip()
-            clock.tick(number_of_floors)
-
-            if not people_list:
-                print("Naive lift has finished.\n")
-                break
-
-        elif number_of_floors > 20:
-            if not people_list:
-                print("Naive lift has finished.\n")
-                break
+        if context.trace is not None:
+            context.trace.record(context.step, naive_lift.current_floor,
+                                 UP if naive_lift.current_direction == "up" else DOWN,
+                                 len(people_on_floor), number_arrived)
 
+        if animation is not None:
+            animation.draw(naive_lift.current_floor, occurrence_array)
+
+    total_wait = context.total_wait
+    total_in_lift = context.total_in_lift
     avg_wait = total_wait // max_people
-    avg_in_lift = total_time_naive // max_people
+    avg_in_lift = total_in_lift // max_people
     life_steps = naive_lift.lifetime_steps
-    print("Number of Floors:", number_of_floors, "floors.")
-    print("Lifetime steps for lift:", life_steps, "steps.")
-    print("Total Time Waiting for Lift:", total_wait, "steps.")
-    print("Total Time in Lift:", total_time_naive, "steps.")
-    print("Number of People:", max_people, "people.")
-    print("Average Wait Time:", avg_wait, "steps per person.")
-    print("Average Time in Lift:", avg_in_lift, "steps per person.")
+    statistics = number_of_floors, life_steps, total_wait, total_in_lift, max_people, avg_wait, avg_in_lift
+    if context.events.records_summary:
+        context.events.summary(None if people_remaining else "Naive lift has finished.", statistics,
+                               context.distributions())
+
+    if context.trace is not None:
+        context.trace.close()
+
+    if animation is not None:
+        animation.close()
 
     if return_stats:
-        return number_of_floors, life_steps, total_wait, total_time_naive, max_people, avg_wait, avg_in_lift
+        return statistics
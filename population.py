@@ -0,0 +1,179 @@
+"""
+This module stores everyone in the building as columns of NumPy arrays,
+one row per person, rather than as one Python object per person. Both
+lift algorithms run against a Population and refer to people by their
+row number. A Scenario holds just the people, so that several runs can
+start from the same building without copying it.
+"""
+import numpy as np
+
+# Person states.
+WAITING = 0
+IN_LIFT = 1
+ARRIVED = 2
+
+# Directions a person can move in, and the names the lifts use for them.
+UP = 0
+DOWN = 1
+DIRECTION_NAMES = ("up", "down")
+
+
+class Scenario:
+    """
+    Who is in the building, where they start and where they are going,
+    with none of the state of a run. Its columns are read only, so one
+    scenario can be shared by any number of runs.
+
+    :param start_floor: The floor each person starts on.
+    :param target_floor: The floor each person gets off on.
+    :param arrival_step: The step each person started waiting on, defaults to None for all 0.
+    """
+
+    def __init__(self, start_floor, target_floor, arrival_step=None):
+        """ Scenario Constructor. """
+        self.start_floor = np.array(start_floor, dtype=np.int32)
+        self.target_floor = np.array(target_floor, dtype=np.int32)
+        self.direction = np.where(self.target_floor > self.start_floor, UP, DOWN).astype(np.int8)
+
+        if arrival_step is None:
+            self.arrival_step = np.zeros(len(self.start_floor), dtype=np.int64)
+        else:
+            self.arrival_step = np.array(arrival_step, dtype=np.int64)
+
+        for column in (self.start_floor, self.target_floor, self.direction, self.arrival_step):
+            column.setflags(write=False)
+
+    def __len__(self) -> int:
+        """ The number of people in the building. """
+        return len(self.start_floor)
+
+    def create_population(self):
+        """
+        Returns a fresh population for a run of this scenario. The
+        population shares the scenario's read only columns and only
+        allocates the columns a run changes.
+
+        :return: Everyone in the building, all waiting.
+        :rtype: Population
+        """
+        return Population(self.start_floor, self.target_floor, self.arrival_step, self.direction)
+
+
+class Population:
+    """
+    Everyone in the building, stored as columns.
+
+    :param start_floor: The floor each person starts on.
+    :param target_floor: The floor each person gets off on.
+    :param arrival_step: The step each person started waiting on, defaults to None for all 0.
+    :param direction: The direction each person is going in, defaults to None to work it out.
+    """
+
+    def __init__(self, start_floor, target_floor, arrival_step=None, direction=None):
+        """ Population Constructor. """
+        self.start_floor = np.asarray(start_floor, dtype=np.int32)
+        self.target_floor = np.asarray(target_floor, dtype=np.int32)
+
+        if direction is None:
+            self.direction = np.where(self.target_floor > self.start_floor, UP, DOWN).astype(np.int8)
+        else:
+            self.direction = np.asarray(direction, dtype=np.int8)
+
+        if arrival_step is None:
+            self.arrival_step = np.zeros(len(self.start_floor), dtype=np.int64)
+        else:
+            self.arrival_step = np.asarray(arrival_step, dtype=np.int64)
+
+        self.state = np.full(len(self.start_floor), WAITING, dtype=np.int8)
+        self.board_step = np.full(len(self.start_floor), -1, dtype=np.int64)
+        self.alight_step = np.full(len(self.start_floor), -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """ The number of people in the building. """
+        return len(self.start_floor)
+
+    @property
+    def nbytes(self) -> int:
+        """ The memory used by all of the columns, in bytes. """
+        return sum(column.nbytes for column in (
+            self.start_floor, self.target_floor, self.direction, self.arrival_step,
+            self.state, self.board_step, self.alight_step
+        ))
+
+    def get_direction(self, person: int) -> str:
+        """
+        Returns the direction a person is moving in.
+
+        :param int person: The row of the person.
+
+        :return: Either up or down.
+        :rtype: str
+        """
+        return DIRECTION_NAMES[self.direction[person]]
+
+    def get_in_lift(self, person: int, step: int):
+        """
+        Sets a person's state to in lift.
+
+        :param int person: The row of the person.
+        :param int step: The step on which the person got in.
+        """
+        self.state[person] = IN_LIFT
+        self.board_step[person] = step
+
+    def get_out_of_lift(self, person: int, step: int):
+        """
+        Sets a person's state to arrived.
+
+        :param int person: The row of the person.
+        :param int step: The step on which the person got out.
+        """
+        self.state[person] = ARRIVED
+        self.alight_step[person] = step
+
+
+def generate_scenario(number_of_floors: int, number_of_people: int, rng=None) -> Scenario:
+    """
+    Creates a set number of people on random floors, with random target floors.
+
+    Start floors are uniform over the building. Anyone on the bottom floor
+    goes up and anyone on the top floor goes down; everyone else picks a
+    direction at random, then a target floor uniformly from the floors in
+    that direction.
+
+    The same seed always gives the same population.
+
+    :param int number_of_floors: The total number of floors, at least 2.
+    :param int number_of_people: The total number of people.
+    :param rng: A seed, SeedSequence or Generator to draw from, defaults to None for fresh entropy.
+
+    :return: The scenario of the building.
+    :rtype: Scenario
+    """
+    rng = np.random.default_rng(rng)
+    start_floor = rng.integers(1, number_of_floors + 1, size=number_of_people)
+
+    going_up = rng.random(number_of_people) < 0.5
+    going_up[start_floor == 1] = True
+    going_up[start_floor == number_of_floors] = False
+
+    # Draw each target from [lowest, highest) in the person's direction.
+    lowest = np.where(going_up, start_floor + 1, 1)
+    highest = np.where(going_up, number_of_floors + 1, start_floor)
+    target_floor = rng.integers(lowest, highest)
+
+    return Scenario(start_floor, target_floor)
+
+
+def generate_population(number_of_floors: int, number_of_people: int, rng=None) -> Population:
+    """
+    Creates a set number of people on random floors, with random target floors, ready for a run.
+
+    :param int number_of_floors: The total number of floors, at least 2.
+    :param int number_of_people: The total number of people.
+    :param rng: A seed, SeedSequence or Generator to draw from, defaults to None for fresh entropy.
+
+    :return: The population of the building.
+    :rtype: Population
+    """
+    return generate_scenario(number_of_floors, number_of_people, rng).create_population()
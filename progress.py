@@ -0,0 +1,69 @@
+"""
+This module reports how far a simulation run has got to another process,
+through a queue, so that the process can show it while the run goes on.
+The same process can cancel the run through an event.
+
+Reports are only put on the queue a few times a second, however fast the
+run is stepping.
+"""
+import time
+
+
+class ProgressReporter:
+    """
+    Reports the progress of a run: the steps done, the people delivered and
+    an estimate of the time left. Each report is a tuple of the step, the
+    number of people delivered, the number of people in the run and the
+    seconds left, or None before anyone has been delivered.
+
+    :param queue: The queue to put reports on, shared with the process watching the run.
+    :param int number_of_people: The number of people the run has to deliver.
+    :param cancel_event: An event that cancels the run once set, defaults to None for no cancelling.
+    :param float interval: The least time between reports in seconds, defaults to 0.1.
+    """
+
+    def __init__(self, queue, number_of_people: int, cancel_event=None, interval: float = 0.1):
+        """ ProgressReporter Constructor. """
+        self.queue = queue
+        self.number_of_people = number_of_people
+        self.cancel_event = cancel_event
+        self.interval = interval
+        self.start_time = None
+        self.next_report_time = 0.0
+
+    def update(self, context):
+        """
+        Reports the progress of a run if a report is due, and finishes the
+        run if it has been cancelled.
+
+        :param RunContext context: The run.
+        """
+        now = time.perf_counter()
+        if now < self.next_report_time:
+            return
+
+        # Timing starts from the first step, not from when the reporter was made.
+        if self.start_time is None:
+            self.start_time = now
+        self.next_report_time = now + self.interval
+
+        delivered = len(context.times_in_lift)
+        self.queue.put((context.step, delivered, self.number_of_people, self.time_left(delivered, now)))
+
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            context.finish()
+
+    def time_left(self, delivered: int, now: float) -> float:
+        """
+        Estimates the time left in a run, from how quickly people have been delivered so far.
+
+        :param int delivered: The number of people delivered so far.
+        :param float now: The current time, from time.perf_counter().
+
+        :return: The estimated seconds left, or None if no one has been delivered.
+        :rtype: float
+        """
+        if not delivered:
+            return None
+
+        return (now - self.start_time) * (self.number_of_people - delivered) / delivered
@@ -0,0 +1,208 @@
+"""
+This module keeps the results of simulation runs on disk, so that a
+sweep only simulates the points it has not seen before.
+
+Each result is stored under a digest of everything that decides it: the
+algorithm, a hash of the code that runs it, the building and the seed.
+Editing the code changes the hash, so stale results are never returned;
+they simply stop being used and are evicted in time.
+"""
+import hashlib
+import pickle
+import sqlite3
+from collections import OrderedDict
+import numpy as np
+
+
+def code_version(*modules) -> str:
+    """
+    Returns a hash of the source of the given modules.
+
+    :param modules: The modules whose code decides a result.
+
+    :return: The hex digest of their source files.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, "rb") as source:
+            digest.update(source.read())
+
+    return digest.hexdigest()
+
+
+def seed_key(seed):
+    """
+    Returns a description of a seed that is the same every time the seed is used.
+
+    :param seed: An int or SeedSequence.
+
+    :return: The description of the seed, or None if the seed is fresh entropy or a Generator
+    and so cannot be cached.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return "SeedSequence", seed.entropy, tuple(seed.spawn_key), seed.pool_size
+    if isinstance(seed, (int, np.integer)):
+        return int(seed)
+
+    return None
+
+
+def make_key(algorithm: str, version: str, number_of_floors: int, number_of_people: int, seed, *extra):
+    """
+    Returns the cache key of a run.
+
+    :param str algorithm: The name of the algorithm.
+    :param str version: The code version of the algorithm.
+    :param int number_of_floors: The total number of floors in the building.
+    :param int number_of_people: The number of people in the building.
+    :param seed: The seed the population was drawn from.
+    :param extra: Anything else that decides the result.
+
+    :return: The hex digest of the run, or None if the run cannot be cached.
+    :rtype: str
+    """
+    seed = seed_key(seed)
+    if seed is None:
+        return None
+
+    description = repr((algorithm, version, int(number_of_floors), int(number_of_people), seed) + extra)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    A size bounded cache of run results, kept in an SQLite file with the
+    most recently used results also held in memory.
+
+    Results are evicted least recently used first. Hits never write to
+    the disk; their last use is written back, all at once, on flush.
+
+    :param str path: The SQLite file to keep results in, defaults to :memory: for a cache that is not kept.
+    :param int max_entries: The most results kept on disk, defaults to 100000.
+    :param int memory_entries: The most results kept in memory, defaults to 1024.
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 100000, memory_entries: int = 1024):
+        """ ResultCache Constructor. """
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.memory = OrderedDict()
+        self.touched = set()
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self.clock = self.connection.execute("SELECT COALESCE(MAX(last_used), 0) FROM results").fetchone()[0]
+        # Counted once here, then kept up to date by put and eviction.
+        self.number_of_rows = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        """ The number of results kept on disk. """
+        return self.number_of_rows
+
+    def __contains__(self, key: str) -> bool:
+        """ Whether a result is kept under a key. """
+        if key in self.memory:
+            return True
+
+        return self.connection.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is not None
+
+    def _tick(self) -> int:
+        """ Returns the next point in the cache's use order. """
+        self.clock += 1
+        return self.clock
+
+    def _remember(self, key: str, value):
+        """ Keeps a result in memory, dropping the least recently used once full. """
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def get(self, key: str, default=None):
+        """
+        Returns the result kept under a key.
+
+        :param str key: The key of the run.
+        :param default: What to return if there is no result, defaults to None.
+
+        :return: The result of the run, or the default.
+        """
+        if key is None:
+            return default
+
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.touched.add(key)
+            return self.memory[key]
+
+        row = self.connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+
+        value = pickle.loads(row[0])
+        self._remember(key, value)
+        self.touched.add(key)
+
+        return value
+
+    def put(self, key: str, value):
+        """
+        Keeps a result under a key, evicting the least recently used results if the cache is full.
+
+        :param str key: The key of the run. Runs with no key are not kept.
+        :param value: The result of the run.
+        """
+        if key is None:
+            return
+
+        self.flush()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.connection:
+            is_replaced = self.connection.execute(
+                "UPDATE results SET value = ?, last_used = ? WHERE key = ?", (blob, self._tick(), key)
+            ).rowcount
+            if not is_replaced:
+                self.connection.execute(
+                    "INSERT INTO results (key, value, last_used) VALUES (?, ?, ?)", (key, blob, self._tick())
+                )
+                self.number_of_rows += 1
+            self._evict()
+        self._remember(key, value)
+
+    def _evict(self):
+        """ Removes the least recently used results until the cache is within its size. """
+        number_over = self.number_of_rows - self.max_entries
+        if number_over <= 0:
+            return
+
+        evicted = self.connection.execute(
+            "SELECT key FROM results ORDER BY last_used LIMIT ?", (number_over,)
+        ).fetchall()
+        self.connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+        self.number_of_rows -= len(evicted)
+        for (key,) in evicted:
+            self.memory.pop(key, None)
+            self.touched.discard(key)
+
+    def flush(self):
+        """ Writes the last use of every hit since the last flush back to disk, in one transaction. """
+        if not self.touched:
+            return
+
+        # Written in the order they were last used, so eviction still sees the true order.
+        touched = [key for key in self.touched if key not in self.memory] + \
+            [key for key in self.memory if key in self.touched]
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE results SET last_used = ? WHERE key = ?", [(self._tick(), key) for key in touched]
+            )
+        self.touched.clear()
+
+    def close(self):
+        """ Flushes and closes the cache. """
+        self.flush()
+        self.connection.close()
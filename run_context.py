@@ -0,0 +1,74 @@
+"""
+This module holds the state that belongs to a single simulation run.
+Each run makes its own RunContext, so runs never share counters and
+any number of them can be made one after another, or side by side in
+threads, in the same process.
+"""
+from event_sink import EventSink, PrintSink
+from histogram import StepHistogram
+from progress import ProgressReporter
+from trace_log import TraceWriter
+
+
+class RunContext:
+    """
+    The counters of a single simulation run, and the sink it reports to.
+    Wait and ride times are also kept as histograms, for their percentiles.
+
+    :param EventSink events: Where the run reports to, defaults to None to print a summary at the end.
+    :param TraceWriter trace: Where to record a trace of the run, closed when the run ends, defaults to None for no trace.
+    :param ProgressReporter progress: Where to report the progress of the run, defaults to None for no reports.
+    """
+
+    def __init__(self, events: EventSink = None, trace: TraceWriter = None, progress: ProgressReporter = None):
+        """ RunContext Constructor. """
+        self.events = events if events is not None else PrintSink()
+        self.trace = trace
+        self.progress = progress
+        self.step = 0
+        self.is_done = False
+        self.total_wait = 0
+        self.total_in_lift = 0
+        self.wait_times = StepHistogram()
+        self.times_in_lift = StepHistogram()
+
+    def advance(self, number_of_steps: int = 1):
+        """
+        Moves the run on by a number of steps.
+
+        :param int number_of_steps: The number of steps to move on by, defaults to 1.
+        """
+        self.step += number_of_steps
+        if self.progress is not None:
+            self.progress.update(self)
+
+    def finish(self):
+        """ Marks the run as done. """
+        self.is_done = True
+
+    def distributions(self) -> dict:
+        """
+        Returns the percentiles and maximum of the wait and ride times so far.
+
+        :return: The summary of each histogram, by name.
+        :rtype: dict
+        """
+        return {"Wait Time": self.wait_times.summary(), "Time in Lift": self.times_in_lift.summary()}
+
+    def record_wait(self, wait: int):
+        """
+        Adds the time a person spent waiting to the run's total.
+
+        :param int wait: The number of steps the person waited.
+        """
+        self.total_wait += wait
+        self.wait_times.record(wait)
+
+    def record_time_in_lift(self, time_in_lift: int):
+        """
+        Adds the time a person spent in the lift to the run's total.
+
+        :param int time_in_lift: The number of steps the person was in the lift.
+        """
+        self.total_in_lift += time_in_lift
+        self.times_in_lift.record(time_in_lift)
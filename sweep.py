@@ -0,0 +1,168 @@
+"""
+This module runs a sweep of lift simulations across a pool of worker
+processes. Each job is one algorithm on one building size, and the
+results are handed back in the same order as the jobs.
+"""
+import itertools
+import os
+from collections import namedtuple
+from multiprocessing import Pool
+import numpy as np
+import monte_carlo
+import population
+import result_cache
+
+ALGORITHM_NAMES = ("naive", "improved")
+
+SweepJob = namedtuple(
+    "SweepJob", ["algorithm", "number_of_floors", "number_of_people", "seed", "number_of_replications"],
+    defaults=[1]
+)
+
+# The code that decides a job's result, so cached results are dropped when it changes.
+CODE_VERSION = result_cache.code_version(monte_carlo, population)
+
+
+def grid_points(floor_counts, populations) -> list:
+    """
+    Returns every pairing of a floor count with a population.
+
+    :param floor_counts: The floor counts to sweep.
+    :param populations: The populations to sweep.
+
+    :return: (number of floors, number of people) for each point of the grid.
+    :rtype: list
+    """
+    return list(itertools.product(floor_counts, populations))
+
+
+def make_jobs(points, algorithms=ALGORITHM_NAMES, number_of_replications: int = 1, seed=None,
+              seeds_per_point: int = 1) -> list:
+    """
+    Creates a job for every algorithm and seed at every point.
+
+    Every point gets its own independent seeds, spawned from a single root
+    seed, so the sweep gives the same results however its jobs are
+    scheduled. A point's seeds depend only on the root seed and the point
+    itself, so adding points to a sweep leaves the others unchanged. Jobs
+    at the same point with the same seed draw the same populations, so the
+    algorithms are compared on the same buildings.
+
+    :param points: (number of floors, number of people) for each point to run.
+    :param algorithms: The algorithms to run at each point, defaults to both.
+    :param int number_of_replications: The number of buildings each job simulates, defaults to 1.
+    :param seed: The root seed of the sweep, an int or SeedSequence, defaults to None for fresh entropy.
+    :param int seeds_per_point: The number of independent seeds to run at each point, defaults to 1.
+
+    :return: The jobs, ordered by point, then seed, then algorithm.
+    :rtype: list
+    """
+    root_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    return [
+        SweepJob(algorithm, number_of_floors, number_of_people,
+                 point_seed(root_seed, number_of_floors, number_of_people, seed_number), number_of_replications)
+        for number_of_floors, number_of_people in points
+        for seed_number in range(seeds_per_point)
+        for algorithm in algorithms
+    ]
+
+
+def point_seed(root_seed: np.random.SeedSequence, number_of_floors: int, number_of_people: int,
+               seed_number: int) -> np.random.SeedSequence:
+    """
+    Returns the seed of a point in a sweep, independent of every other point's.
+
+    :param np.random.SeedSequence root_seed: The root seed of the sweep.
+    :param int number_of_floors: The total number of floors at the point.
+    :param int number_of_people: The number of people at the point.
+    :param int seed_number: Which of the point's seeds to return.
+
+    :return: The seed of the point.
+    :rtype: np.random.SeedSequence
+    """
+    return np.random.SeedSequence(
+        root_seed.entropy,
+        spawn_key=tuple(root_seed.spawn_key) + (int(number_of_floors), int(number_of_people), seed_number),
+        pool_size=root_seed.pool_size
+    )
+
+
+def job_key(job: SweepJob) -> str:
+    """
+    Returns the result cache key of a job.
+
+    :param SweepJob job: The job.
+
+    :return: The key of the job, or None if the job cannot be cached.
+    :rtype: str
+    """
+    return result_cache.make_key(
+        job.algorithm, CODE_VERSION, job.number_of_floors, job.number_of_people, job.seed, job.number_of_replications
+    )
+
+
+def run_job(job: SweepJob) -> tuple:
+    """
+    Runs a single job.
+
+    :param SweepJob job: The job to run.
+
+    :return: The statistics of the job's algorithm, one entry per replication.
+    :rtype: tuple
+    """
+    return monte_carlo.run_replications(
+        job.algorithm, job.number_of_floors, job.number_of_people, job.number_of_replications, job.seed
+    )
+
+
+def _run_indexed_job(indexed_job: tuple) -> tuple:
+    """ Runs a job, keeping its position in the sweep alongside its statistics. """
+    index, job = indexed_job
+    return index, run_job(job)
+
+
+def run_sweep(jobs: list, processes: int = None, cache: result_cache.ResultCache = None) -> list:
+    """
+    Runs every job across a pool of worker processes.
+
+    The biggest jobs are handed out first so that no worker is left with a
+    long job at the end of the sweep. Given a cache, only the jobs it does
+    not already hold are run, and their results are added to it.
+
+    :param list jobs: The jobs to run.
+    :param int processes: The number of worker processes, defaults to None for one per CPU.
+    :param ResultCache cache: The cache of earlier results, defaults to None to run every job.
+
+    :return: The statistics of each job, in the same order as the jobs.
+    :rtype: list
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    results = [None] * len(jobs)
+    keys = [None] * len(jobs)
+    if cache is not None:
+        keys = [job_key(job) for job in jobs]
+        results = [cache.get(key) for key in keys]
+
+    indexed_jobs = sorted(
+        ((index, job) for index, job in enumerate(jobs) if results[index] is None),
+        key=lambda indexed_job: indexed_job[1].number_of_floors * indexed_job[1].number_of_people *
+        indexed_job[1].number_of_replications,
+        reverse=True
+    )
+
+    if not indexed_jobs:
+        return results
+
+    with Pool(processes=processes) as pool:
+        for index, statistics in pool.imap_unordered(_run_indexed_job, indexed_jobs):
+            results[index] = statistics
+            if cache is not None:
+                cache.put(keys[index], statistics)
+
+    if cache is not None:
+        cache.flush()
+
+    return results
@@ -0,0 +1,161 @@
+"""
+Tests that lock in the properties the faster paths of the simulation rely
+on. Run them with python -m unittest, or with pytest.
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import improved_algorithm
+import monte_carlo
+import naive_algorithm
+from event_sink import EventSink
+from population import Scenario, generate_scenario
+from result_cache import ResultCache
+from run_context import RunContext
+
+
+def random_scenarios(number_of_scenarios: int, max_floors: int = 40, max_people: int = 120):
+    """
+    Yields random buildings, each drawn from its own seed.
+
+    :param int number_of_scenarios: The number of buildings.
+    :param int max_floors: The most floors in a building, defaults to 40.
+    :param int max_people: The most people in a building, defaults to 120.
+
+    :return: The number of floors, the number of people and the scenario of each building.
+    :rtype: tuple
+    """
+    for seed in range(number_of_scenarios):
+        rng = np.random.default_rng(seed)
+        number_of_floors = int(rng.integers(2, max_floors + 1))
+        number_of_people = int(rng.integers(1, max_people + 1))
+        yield number_of_floors, number_of_people, generate_scenario(number_of_floors, number_of_people, rng)
+
+
+def run_naive(number_of_floors: int, scenario, event_driven: bool) -> tuple:
+    """ Runs the naive lift over a scenario, without reporting, and returns its statistics. """
+    return naive_algorithm.naive_lift_algorithm(number_of_floors, scenario, return_stats=True, animate=False,
+                                                event_driven=event_driven, context=RunContext(EventSink()))
+
+
+def run_improved(number_of_floors: int, number_of_people: int, scenario, event_driven: bool) -> tuple:
+    """ Runs the improved lift over a scenario, without reporting, and returns its statistics. """
+    return improved_algorithm.better_lift_algorithm(number_of_floors, number_of_people, scenario, animate=False,
+                                                    event_driven=event_driven, context=RunContext(EventSink()))
+
+
+class EventDrivenTest(unittest.TestCase):
+    """ Skipping the floors where nothing happens must not change any statistic. """
+
+    def test_naive(self):
+        for number_of_floors, number_of_people, scenario in random_scenarios(100):
+            with self.subTest(number_of_floors=number_of_floors, number_of_people=number_of_people):
+                self.assertEqual(run_naive(number_of_floors, scenario, event_driven=True),
+                                 run_naive(number_of_floors, scenario, event_driven=False))
+
+    def test_improved(self):
+        for number_of_floors, number_of_people, scenario in random_scenarios(100):
+            with self.subTest(number_of_floors=number_of_floors, number_of_people=number_of_people):
+                self.assertEqual(run_improved(number_of_floors, number_of_people, scenario, event_driven=True),
+                                 run_improved(number_of_floors, number_of_people, scenario, event_driven=False))
+
+
+class MonteCarloTest(unittest.TestCase):
+    """ Each replication of a batch must give the same statistics as the scalar engine run alone. """
+
+    def assert_rows_match(self, replications, run_scalar):
+        """
+        Runs batches of random buildings and checks every row against the scalar engine.
+
+        :param replications: The batched engine, naive_replications or improved_replications.
+        :param run_scalar: Runs the scalar engine over one building, given its floors, people and scenario.
+        """
+        for seed in range(30):
+            rng = np.random.default_rng(seed)
+            number_of_floors = int(rng.integers(2, 41))
+            number_of_people = int(rng.integers(1, 61))
+            number_of_replications = int(rng.integers(1, 9))
+            scenario = generate_scenario(number_of_floors, number_of_people * number_of_replications, rng)
+            start_floor = scenario.start_floor.reshape(number_of_replications, number_of_people)
+            target_floor = scenario.target_floor.reshape(number_of_replications, number_of_people)
+
+            statistics = replications(number_of_floors, start_floor, target_floor)
+            for row in range(number_of_replications):
+                with self.subTest(seed=seed, row=row):
+                    expected = run_scalar(number_of_floors, number_of_people,
+                                          Scenario(start_floor[row], target_floor[row]))
+                    actual = tuple(int(value[row]) if np.ndim(value) else value for value in statistics)
+                    self.assertEqual(actual, expected)
+
+    def test_naive(self):
+        self.assert_rows_match(
+            monte_carlo.naive_replications,
+            lambda number_of_floors, _, scenario: run_naive(number_of_floors, scenario, event_driven=True)
+        )
+
+    def test_improved(self):
+        self.assert_rows_match(
+            monte_carlo.improved_replications,
+            lambda number_of_floors, number_of_people, scenario: run_improved(
+                number_of_floors, number_of_people, scenario, event_driven=True
+            )
+        )
+
+
+class ResultCacheTest(unittest.TestCase):
+    """ A full cache must evict the least recently used result first, however it was last used. """
+
+    def assert_keys(self, cache: ResultCache, kept: str, evicted: str):
+        """ Checks which keys a cache still holds. """
+        self.assertEqual(len(cache), len(kept))
+        for key in kept:
+            self.assertIn(key, cache)
+        for key in evicted:
+            self.assertNotIn(key, cache)
+
+    def test_memory_hit(self):
+        cache = ResultCache(max_entries=3)
+        for key in "abc":
+            cache.put(key, key.upper())
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("d", "D")
+        self.assert_keys(cache, kept="acd", evicted="b")
+
+    def test_disk_hit(self):
+        # Only the last result put is held in memory, so the hit on "a" is read from disk.
+        cache = ResultCache(max_entries=3, memory_entries=1)
+        for key in "abc":
+            cache.put(key, key.upper())
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("d", "D")
+        self.assert_keys(cache, kept="acd", evicted="b")
+
+    def test_replace(self):
+        cache = ResultCache(max_entries=3)
+        for key in "abca":
+            cache.put(key, key.upper())
+        cache.put("d", "D")
+        self.assert_keys(cache, kept="acd", evicted="b")
+
+    def test_reopen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.sqlite")
+            cache = ResultCache(path, max_entries=3)
+            for key in "abc":
+                cache.put(key, key.upper())
+            cache.get("a")
+            cache.close()
+
+            # The hit on "a" was only written back on close, and must still count.
+            cache = ResultCache(path, max_entries=3)
+            self.assertEqual(cache.get("b"), "B")
+            cache.put("d", "D")
+            self.assert_keys(cache, kept="abd", evicted="c")
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
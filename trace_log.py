@@ -0,0 +1,123 @@
+"""
+This module records a trace of a simulation run to a binary file, one
+fixed width record per step simulated (per stop, when event driven), so
+that an odd run can be looked at afterwards instead of re-run.
+
+A trace file is a header, the number of people waiting on each floor at
+the start, then the records. The records are only ever appended, and can
+be memory-mapped as a NumPy array however long the run was.
+"""
+import os
+import struct
+import numpy as np
+
+MAGIC = b"LIFTTRC1"
+
+# Magic, header size, number of floors, number of people.
+HEADER = struct.Struct("<8sIII")
+
+TRACE_DTYPE = np.dtype([
+    ("step", "<i8"),
+    ("floor", "<i4"),
+    ("direction", "i1"),
+    ("boarded", "<u2"),
+    ("alighted", "<u2")
+])
+
+
+class TraceWriter:
+    """
+    Appends the records of a run to a trace file, a chunk at a time. The
+    file is opened when a run starts and closed when it ends, so the same
+    writer can record one run after another.
+
+    :param str path: The file to write the trace to.
+    :param int chunk_size: The number of records held before they are written, defaults to 4096.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 4096):
+        """ TraceWriter Constructor. """
+        self.path = path
+        self.file = None
+        self.chunk = np.zeros(chunk_size, dtype=TRACE_DTYPE)
+        self.chunk_length = 0
+        self.number_of_records = 0
+
+    def start(self, number_of_floors: int, floor_counts: list):
+        """
+        Starts the trace file of a run, closing the last one if it was left open.
+
+        :param int number_of_floors: The total number of floors in the building.
+        :param list floor_counts: The number of people waiting on each floor, indexed by floor. Index 0 is unused.
+        """
+        self.close()
+        self.number_of_records = 0
+
+        floor_counts = np.asarray(floor_counts, dtype="<i4")
+        self.file = open(self.path, "wb")
+        self.file.write(HEADER.pack(
+            MAGIC, HEADER.size + floor_counts.nbytes, number_of_floors, int(floor_counts.sum())
+        ))
+        self.file.write(floor_counts.tobytes())
+
+    def record(self, step: int, floor: int, direction: int, boarded: int, alighted: int):
+        """
+        Records a step the lift stopped on.
+
+        :param int step: The step.
+        :param int floor: The floor the lift is on.
+        :param int direction: The direction of the lift, UP or DOWN.
+        :param int boarded: The number of people that got in.
+        :param int alighted: The number of people that got out.
+        """
+        self.chunk[self.chunk_length] = (step, floor, direction, boarded, alighted)
+        self.chunk_length += 1
+        self.number_of_records += 1
+
+        if self.chunk_length == len(self.chunk):
+            self.flush()
+
+    def flush(self):
+        """ Writes every held record to the file. """
+        if self.chunk_length:
+            self.file.write(self.chunk[:self.chunk_length].tobytes())
+            self.chunk_length = 0
+
+        self.file.flush()
+
+    def close(self):
+        """ Writes every held record and closes the file. """
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+
+class Trace:
+    """
+    A trace file opened for reading. The records are memory-mapped, so
+    nothing is read until it is used.
+
+    :param str path: The trace file to open.
+    """
+
+    def __init__(self, path: str):
+        """ Trace Constructor. """
+        with open(path, "rb") as file:
+            magic, header_size, self.number_of_floors, self.number_of_people = HEADER.unpack(
+                file.read(HEADER.size)
+            )
+            if magic != MAGIC:
+                raise ValueError(path + " is not a lift trace.")
+
+            self.floor_counts = np.frombuffer(file.read(header_size - HEADER.size), dtype="<i4")
+
+        # An empty file cannot be mapped, so a trace with no records gets an empty array.
+        if os.path.getsize(path) > header_size:
+            self.records = np.memmap(path, dtype=TRACE_DTYPE, mode="r", offset=header_size)
+        else:
+            self.records = np.zeros(0, dtype=TRACE_DTYPE)
+
+    def __len__(self) -> int:
+        """ The number of records in the trace. """
+        return len(self.records)